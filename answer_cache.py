@@ -0,0 +1,84 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from text_analyzer import WORD_PATTERN, analyze, normalize
+
+
+def normalize_question(question):
+    return " ".join(WORD_PATTERN.findall(normalize(question)))
+
+
+def fingerprint(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, max_entries=256, ttl_seconds=3600, similarity_threshold=1.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, doc_key, question, context_text):
+        return (doc_key, normalize_question(question), fingerprint(context_text))
+
+    def _expired(self, entry, now):
+        return self.ttl_seconds > 0 and now - entry['created'] > self.ttl_seconds
+
+    def get(self, doc_key, question, context_text):
+        key = self._key(doc_key, question, context_text)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry['answer']
+
+            if self.similarity_threshold <= 0:
+                return None
+
+            keywords = frozenset(analyze(question))
+            if not keywords:
+                return None
+
+            best_key, best_similarity = None, 0.0
+            for other_key, other in list(self._entries.items()):
+                if self._expired(other, now):
+                    del self._entries[other_key]
+                    continue
+                if other_key[0] != doc_key:
+                    continue
+                similarity = len(keywords & other['keywords']) / len(keywords | other['keywords'])
+                if similarity > best_similarity:
+                    best_key, best_similarity = other_key, similarity
+
+            if best_key is not None and best_similarity >= self.similarity_threshold:
+                self._entries.move_to_end(best_key)
+                return self._entries[best_key]['answer']
+            return None
+
+    def put(self, doc_key, question, context_text, answer):
+        key = self._key(doc_key, question, context_text)
+        with self._lock:
+            self._entries[key] = {
+                'answer': answer,
+                'keywords': frozenset(analyze(question)),
+                'created': time.monotonic()
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,15 +1,28 @@
 import sys
 import os
+import multiprocessing
 
 from platform_config import CURRENT_PLATFORM, IS_ANDROID
 
-print(f"Platform detected: {CURRENT_PLATFORM}")
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
 
-if IS_ANDROID:
-    print("Starting Kivy UI for Android...")
-    from main_kivy import main as kivy_main
-    kivy_main()
-else:
-    print("Starting PyQt6 UI for Desktop...")
-    from main import app, window
-    sys.exit(app.exec())
+    if "--server" in sys.argv:
+        from server import main as server_main
+        server_main([arg for arg in sys.argv[1:] if arg != "--server"])
+        sys.exit(0)
+
+    if "--batch" in sys.argv:
+        from batch import main as batch_main
+        sys.exit(batch_main([arg for arg in sys.argv[1:] if arg != "--batch"]))
+
+    print(f"Platform detected: {CURRENT_PLATFORM}")
+
+    if IS_ANDROID:
+        print("Starting Kivy UI for Android...")
+        from main_kivy import main as kivy_main
+        kivy_main()
+    else:
+        print("Starting PyQt6 UI for Desktop...")
+        from main import app, window
+        sys.exit(app.exec())
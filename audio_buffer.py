@@ -0,0 +1,145 @@
+import struct
+from collections import deque
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# (format tag, bits) -> (numpy dtype, offset, scale) such that (sample - offset) / scale lies in [-1, 1]
+SAMPLE_TYPES = {
+    (WAVE_FORMAT_PCM, 8): (np.uint8, 128.0, 128.0),
+    (WAVE_FORMAT_PCM, 16): (np.int16, 0.0, 32768.0),
+    (WAVE_FORMAT_PCM, 32): (np.int32, 0.0, 2147483648.0),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): (np.float32, 0.0, 1.0),
+}
+
+
+class PcmBuffer:
+    __slots__ = ('data', 'sample_rate', 'channels', 'bits', 'format_tag', 'dtype', 'offset', 'scale')
+
+    def __init__(self, data, sample_rate, channels=1, bits=16, format_tag=WAVE_FORMAT_PCM):
+        if (format_tag, bits) not in SAMPLE_TYPES:
+            raise ValueError(f"Desteklenmeyen ses biçimi: {format_tag}/{bits} bit")
+        self.data = memoryview(data).cast('B')
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bits = bits
+        self.format_tag = format_tag
+        self.dtype, self.offset, self.scale = SAMPLE_TYPES[(format_tag, bits)]
+        frame = self.frame_bytes
+        if len(self.data) % frame:
+            self.data = self.data[:len(self.data) - len(self.data) % frame]
+
+    @property
+    def frame_bytes(self):
+        return self.channels * self.bits // 8
+
+    @property
+    def frames(self):
+        return len(self.data) // self.frame_bytes
+
+    @property
+    def byte_rate(self):
+        return self.sample_rate * self.frame_bytes
+
+    @property
+    def duration_ms(self):
+        return self.frames * 1000 / self.sample_rate
+
+    def same_format(self, other):
+        return (self.sample_rate, self.channels, self.bits, self.format_tag) == \
+            (other.sample_rate, other.channels, other.bits, other.format_tag)
+
+    # First channel, viewed without copying
+    def samples(self):
+        return np.frombuffer(self.data, dtype=self.dtype)[::self.channels]
+
+    def normalized(self, samples):
+        return (samples.astype(np.float32) - self.offset) / self.scale
+
+
+# Same-format segments read back to back as one byte stream
+class PcmStream:
+    def __init__(self):
+        self.segments = deque()
+        self.format = None
+        self.end = 0
+        self.read_position = 0
+
+    def accepts(self, pcm):
+        return self.format is None or self.format.same_format(pcm)
+
+    def append(self, pcm):
+        if not self.accepts(pcm):
+            raise ValueError("Akışa farklı biçimde ses eklenemez")
+        if self.format is None:
+            self.format = pcm
+        self.segments.append((self.end, pcm))
+        self.end += len(pcm.data)
+
+    @property
+    def remaining(self):
+        return self.end - self.read_position
+
+    def _segment(self, position):
+        for start, pcm in self.segments:
+            if position < start + len(pcm.data):
+                return start, pcm
+        return None, None
+
+    def read(self, maxlen):
+        parts = []
+        while maxlen > 0 and self.read_position < self.end:
+            start, pcm = self._segment(self.read_position)
+            offset = self.read_position - start
+            part = pcm.data[offset:offset + maxlen]
+            parts.append(part)
+            self.read_position += len(part)
+            maxlen -= len(part)
+        return b"".join(parts)
+
+    def release(self, position):
+        while self.segments and self.segments[0][0] + len(self.segments[0][1].data) <= position:
+            self.segments.popleft()
+
+    def window(self, position, frames):
+        start, pcm = self._segment(position)
+        if pcm is None:
+            return None
+        first = (position - start) // pcm.frame_bytes
+        return pcm.normalized(pcm.samples()[first:first + frames])
+
+
+def parse_wav(data):
+    view = memoryview(data).cast('B')
+    if len(view) < 12 or bytes(view[0:4]) != b"RIFF" or bytes(view[8:12]) != b"WAVE":
+        raise ValueError("Geçerli bir WAV verisi değil")
+
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id = bytes(view[pos:pos + 4])
+        size = struct.unpack_from('<I', view, pos + 4)[0]
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            format_tag, channels, sample_rate = struct.unpack_from('<HHI', view, body)
+            bits = struct.unpack_from('<H', view, body + 14)[0]
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and size >= 26:
+                format_tag = struct.unpack_from('<H', view, body + 24)[0]
+            fmt = (sample_rate, channels, bits, format_tag)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV 'fmt ' bölümü eksik")
+            # Some writers leave the size at 0/0xFFFFFFFF when streaming; take what is there.
+            end = min(body + size, len(view)) if size else len(view)
+            sample_rate, channels, bits, format_tag = fmt
+            return PcmBuffer(view[body:end], sample_rate, channels, bits, format_tag)
+        pos = body + size + (size & 1)
+    raise ValueError("WAV 'data' bölümü bulunamadı")
+
+
+def read_wav(path):
+    with open(path, 'rb') as f:
+        return parse_wav(f.read())
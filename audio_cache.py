@@ -0,0 +1,57 @@
+import hashlib
+import os
+import shutil
+
+from document_cache import evict_oldest
+from text_processor import process_text_for_tts
+
+
+class AudioCache:
+    def __init__(self, cache_dir, max_bytes=128 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key_for(self, text, voice, rate):
+        normalized = process_text_for_tts(text)
+        return hashlib.sha256(f"{voice}\0{rate}\0{normalized}".encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    def _voice_path(self):
+        return os.path.join(self.cache_dir, "voice.txt")
+
+    def load_voice(self):
+        try:
+            with open(self._voice_path(), encoding='utf-8') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def save_voice(self, voice_id):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._voice_path(), 'w', encoding='utf-8') as f:
+                f.write(voice_id)
+        except OSError:
+            pass
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            if os.path.getsize(path) > 0:
+                os.utime(path)
+                return path
+        except OSError:
+            pass
+        return None
+
+    def put(self, key, source_path):
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            shutil.move(source_path, path)
+        except OSError:
+            return None
+        evict_oldest(self.cache_dir, ".wav", self.max_bytes)
+        return path
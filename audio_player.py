@@ -0,0 +1,133 @@
+from collections import deque
+
+from PyQt6.QtCore import QObject, QIODevice, pyqtSignal
+from PyQt6.QtMultimedia import QAudio, QAudioFormat, QAudioSink, QMediaDevices
+
+from audio_buffer import WAVE_FORMAT_IEEE_FLOAT, PcmStream
+
+SAMPLE_FORMATS = {
+    8: QAudioFormat.SampleFormat.UInt8,
+    16: QAudioFormat.SampleFormat.Int16,
+    32: QAudioFormat.SampleFormat.Int32,
+}
+
+
+def audio_format(pcm):
+    fmt = QAudioFormat()
+    fmt.setSampleRate(pcm.sample_rate)
+    fmt.setChannelCount(pcm.channels)
+    if pcm.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        fmt.setSampleFormat(QAudioFormat.SampleFormat.Float)
+    else:
+        fmt.setSampleFormat(SAMPLE_FORMATS[pcm.bits])
+    return fmt
+
+
+# Segments appended to the stream are played without restarting the sink
+class PcmDevice(QIODevice):
+    def __init__(self, stream, parent=None):
+        super().__init__(parent)
+        self.stream = stream
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return self.stream.remaining + super().bytesAvailable()
+
+    def readData(self, maxlen):
+        return self.stream.read(maxlen)
+
+    def writeData(self, data):
+        return -1
+
+
+class PcmPlayer(QObject):
+    started = pyqtSignal()
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sink = None
+        self.device = None
+        self.stream = None
+        self.waiting = deque()
+        self.volume = 1.0
+
+    @property
+    def sample_rate(self):
+        return self.stream.format.sample_rate if self.stream is not None else 0
+
+    def enqueue(self, pcm):
+        if self.stream is None:
+            self._start(pcm)
+        elif self.waiting or not self.stream.accepts(pcm):
+            self.waiting.append(pcm)
+        else:
+            self.stream.append(pcm)
+            self.device.readyRead.emit()
+
+    def _start(self, pcm):
+        fmt = audio_format(pcm)
+        if self.sink is None or self.sink.format() != fmt:
+            if self.sink is not None:
+                self.sink.deleteLater()
+            self.sink = QAudioSink(QMediaDevices.defaultAudioOutput(), fmt, self)
+            self.sink.setVolume(self.volume)
+            self.sink.stateChanged.connect(self.on_state_changed)
+        self.stream = PcmStream()
+        self.stream.append(pcm)
+        self.device = PcmDevice(self.stream, self)
+        self.device.open(QIODevice.OpenModeFlag.ReadOnly)
+        self.sink.start(self.device)
+
+    def stop(self):
+        self.waiting.clear()
+        self._close()
+
+    def _close(self):
+        device, self.device = self.device, None
+        self.stream = None
+        if self.sink is not None:
+            self.sink.stop()
+        if device is not None:
+            device.close()
+            device.deleteLater()
+
+    # Bytes handed to the sink minus what is still buffered: what is being heard now
+    def position(self):
+        if self.stream is None:
+            return 0
+        queued = max(0, self.sink.bufferSize() - self.sink.bytesFree())
+        return max(0, self.stream.read_position - queued)
+
+    def position_ms(self):
+        if self.stream is None:
+            return 0.0
+        return self.position() * 1000 / self.stream.format.byte_rate
+
+    def window(self, frames):
+        if self.stream is None:
+            return None
+        position = self.position()
+        self.stream.release(position)
+        return self.stream.window(position, frames)
+
+    def on_state_changed(self, state):
+        if self.device is None:
+            return
+        if state == QAudio.State.ActiveState:
+            self.started.emit()
+        elif state == QAudio.State.IdleState and self.stream.remaining == 0:
+            if self.waiting:
+                waiting = list(self.waiting)
+                self.stop()
+                for pcm in waiting:
+                    self.enqueue(pcm)
+            else:
+                self.finished.emit()
+        elif state == QAudio.State.StoppedState and self.sink.error() != QAudio.Error.NoError:
+            error = self.sink.error()
+            self.stop()
+            self.error.emit(f"Ses çıkışı hatası: {error.name}")
@@ -2,7 +2,7 @@ import math
 import random
 import numpy as np
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QPointF, QElapsedTimer
+from PyQt6.QtCore import Qt, QTimer, QPointF
 from PyQt6.QtGui import QColor, QPainter, QPen, QBrush, QFont, QLinearGradient, QRadialGradient, QPainterPath
 
 class SpeakingVisualizer(QWidget):
@@ -11,14 +11,9 @@ class SpeakingVisualizer(QWidget):
         self.setMinimumHeight(220)
         self.active = False
         self.time = 0.0
-        self.audio_data = None
-        self.audio_position = 0
-        self.sample_rate = 44100
-        self.samples_per_frame = 735
+        self.source = None
         self.frequency_bands = [0.0] * 64  # Daha fazla band = daha smooth waveform
         self.frame_count = 0
-        self.stopwatch = QElapsedTimer()
-        self.stopwatch.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_animation)
         
@@ -28,112 +23,20 @@ class SpeakingVisualizer(QWidget):
         self.peak_values = [0.0] * 64  # Peak hold mekanizması
         self.peak_decay = 0.97  # DENGELİ - smooth ama responsive
 
-    def set_audio_data(self, file_path):
-        try:
-            import wave
-            import subprocess
-            import tempfile
-            import os
-            import struct
-            self.audio_data = None
-            wav_path = file_path
-            temp_wav = None
-            import imageio_ffmpeg
-            ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-            fd, temp_wav = tempfile.mkstemp(suffix='.wav')
-            os.close(fd)
-            try:
-                subprocess.run([
-                    ffmpeg_exe, "-y", "-i", file_path, 
-                    "-vn", "-acodec", "pcm_s16le", "-ac", "1", "-ar", "44100", 
-                    "-f", "wav", temp_wav
-                ], check=True, stdout=subprocess.DEVNULL, stderr=None)
-                wav_path = temp_wav
-            except Exception as e_ffmpeg:
-                try:
-                    subprocess.run([
-                        "ffmpeg", "-y", "-i", file_path, 
-                        "-vn", "-acodec", "pcm_s16le", "-ac", "1", "-ar", "44100", 
-                        "-f", "wav", temp_wav
-                    ], check=True, stdout=subprocess.DEVNULL, stderr=None)
-                    wav_path = temp_wav
-                except Exception as e_sys:
-                    wav_path = file_path
-
-            try:
-                with wave.open(wav_path, 'rb') as wf:
-                    self.sample_rate = wf.getframerate()
-                    n_frames = wf.getnframes()
-                    raw_bytes = wf.readframes(n_frames)
-                    if wf.getsampwidth() == 2:
-                        total_samples = len(raw_bytes) // 2
-                        fmt = f"{total_samples}h"
-                        samples = struct.unpack(fmt, raw_bytes)
-                        samples = np.array(samples, dtype=np.float32)
-                        samples = samples / 32768.0
-                    else:
-                        raise ValueError("Only 16-bit PCM supported by simple reader")
-                    self.audio_data = samples
-            except Exception as e_wave:
-                try:
-                    with open(wav_path, 'rb') as f:
-                        f.seek(0)
-                        header = f.read(44)
-                        audio_fmt = struct.unpack('<H', header[20:22])[0]
-                        n_channels = struct.unpack('<H', header[22:24])[0]
-                        self.sample_rate = struct.unpack('<I', header[24:28])[0]
-                        bits_per_sample = struct.unpack('<H', header[34:36])[0]
-                        f.seek(0)
-                        raw = f.read()
-                        data_offset = raw.find(b'data')
-                        if data_offset != -1:
-                            data_offset += 8
-                        else:
-                            data_offset = 44
-                        if bits_per_sample == 16:
-                            samples = np.frombuffer(raw, dtype=np.int16, offset=data_offset)
-                            samples = samples.astype(np.float32) / 32768.0
-                        elif bits_per_sample == 32:
-                            if audio_fmt == 3:
-                                samples = np.frombuffer(raw, dtype=np.float32, offset=data_offset)
-                            else:
-                                samples = np.frombuffer(raw, dtype=np.int32, offset=data_offset)
-                                samples = samples.astype(np.float32) / 2147483648.0
-                        else:
-                            raise ValueError(f"Unsupported bits: {bits_per_sample}")
-                        if n_channels > 1:
-                            samples = samples[::n_channels]
-                        self.audio_data = samples
-                except Exception as e_manual:
-                    raise e_wave
-
-
-            self.duration_ms = (len(self.audio_data) / self.sample_rate) * 1000
-            if temp_wav and os.path.exists(temp_wav):
-                os.remove(temp_wav)
-            self.audio_position = 0
-            self.samples_per_frame = int(self.sample_rate / 60)
-            self.frame_count = 0
-            self.time = 0.0
-            self.active = True
-            self.stopwatch = QElapsedTimer()
-            self.stopwatch.start()
-            if not self.timer.isActive():
-                self.timer.start(16)
-            self.setVisible(True)
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            self.audio_data = None
+    def set_source(self, source):
+        self.source = source
+        self.frame_count = 0
+        self.time = 0.0
+        self.active = True
+        if not self.timer.isActive():
+            self.timer.start(16)
+        self.setVisible(True)
 
     def start(self):
         self.active = True
         self.time = 0.0
         self.frame_count = 0
         self.frequency_bands = [0.0] * 64
-        self.stopwatch = QElapsedTimer()
-        self.stopwatch.start()
         if not self.timer.isActive():
             self.timer.start(16)
         self.setVisible(True)
@@ -141,7 +44,7 @@ class SpeakingVisualizer(QWidget):
     def stop(self):
         self.active = False
         self.timer.stop()
-        self.audio_data = None
+        self.source = None
         self.setVisible(False)
 
     def update_animation(self):
@@ -149,19 +52,12 @@ class SpeakingVisualizer(QWidget):
             self.frame_count += 1
         if not self.active:
             return
-        current_time_ms = self.stopwatch.elapsed()
         self.time += 0.016 
 
-        if self.audio_data is not None and len(self.audio_data) > 0:
-            sample_pos = int((current_time_ms / 1000.0) * self.sample_rate)
-            if sample_pos < len(self.audio_data):
-                start = sample_pos
-                end = min(sample_pos + self.samples_per_frame, len(self.audio_data))
-                chunk = self.audio_data[start:end]
-                if len(chunk) > 32:
-                    self.analyze_frequencies(chunk)
-                else:
-                    self.fade_out_bands()
+        if self.source is not None:
+            chunk = self.source.window(int(self.source.sample_rate / 60))
+            if chunk is not None and len(chunk) > 32:
+                self.analyze_frequencies(chunk)
             else:
                 self.fade_out_bands()
         else:
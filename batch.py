@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import config
+
+
+def read_questions(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith('#')]
+
+
+async def answer_all(rag_system, questions, contexts, api_key):
+    async def run(index, question, context):
+        context_text, doc_key, sources = context
+        record = {'index': index, 'question': question, 'sources': sources}
+        if not context_text.strip():
+            record.update(answer=None, fallback=True, error=False, answer_ms=0.0)
+            return record
+
+        start = time.perf_counter()
+        answer = await rag_system.aanswer(question, context_text, doc_key, api_key)
+        record.update(
+            answer=answer,
+            fallback=False,
+            error=answer.startswith("API Hatası"),
+            answer_ms=round((time.perf_counter() - start) * 1000, 1)
+        )
+        return record
+
+    try:
+        return await asyncio.gather(*(
+            run(index, question, context)
+            for index, (question, context) in enumerate(zip(questions, contexts))
+        ))
+    finally:
+        await rag_system.chat_clients.aclose()
+
+
+def run_batch(rag_system, questions, api_key, max_tokens=None):
+    start = time.perf_counter()
+    contexts = rag_system.build_contexts(questions, max_tokens or config.MAX_CONTEXT_TOKENS)
+    retrieval_ms = (time.perf_counter() - start) * 1000
+
+    records = asyncio.run(answer_all(rag_system, questions, contexts, api_key))
+    per_question = round(retrieval_ms / max(1, len(questions)), 3)
+    for record in records:
+        record['retrieval_ms'] = per_question
+    return records, retrieval_ms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="R.A.G PDF Asistanı toplu soru-cevap")
+    parser.add_argument("questions", help="Her satırda bir soru içeren dosya ('#' ile başlayanlar atlanır)")
+    parser.add_argument("--pdf", action="append", required=True, help="Yüklenecek PDF (tekrarlanabilir)")
+    parser.add_argument("--output", default="answers.jsonl")
+    parser.add_argument("--max-tokens", type=int, default=config.MAX_CONTEXT_TOKENS, help="Soru başına bağlam bütçesi")
+    parser.add_argument("--concurrency", type=int, default=config.ASYNC_MAX_CONCURRENCY)
+    args = parser.parse_args(argv)
+
+    if not config.API_KEY:
+        print("Hata: OPENAI_API_KEY tanımlı değil", file=sys.stderr)
+        return 1
+
+    from rag_system import RAGSystem
+
+    rag_system = RAGSystem()
+    rag_system.max_concurrency = args.concurrency
+    for pdf_path in args.pdf:
+        count = rag_system.process_pdf(pdf_path)
+        print(f"{pdf_path}: {count} sayfa yüklendi")
+
+    questions = read_questions(args.questions)
+    start = time.perf_counter()
+    records, retrieval_ms = run_batch(rag_system, questions, config.API_KEY, args.max_tokens)
+    elapsed = time.perf_counter() - start
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    errors = sum(record['error'] for record in records)
+    print(f"{len(records)} soru, {elapsed:.1f} sn (arama: {retrieval_ms:.1f} ms), {errors} hata -> {args.output}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
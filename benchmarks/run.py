@@ -0,0 +1,332 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import config
+from synthetic_pdf import sample_questions, write_pdf
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+HIGHER_IS_BETTER = ("pages_per_sec", "queries_per_sec")
+
+
+class MockChat:
+    def __init__(self, latency, token_delay, answer_tokens):
+        self.latency = latency
+        self.token_delay = token_delay
+        self.answer_tokens = answer_tokens
+
+    def _tokens(self):
+        return [f"kelime{i} " for i in range(self.answer_tokens)]
+
+    def invoke(self, messages):
+        from langchain_core.messages import AIMessage
+        time.sleep(self.latency + self.token_delay * self.answer_tokens)
+        return AIMessage(content="".join(self._tokens()))
+
+    def stream(self, messages):
+        from langchain_core.messages import AIMessageChunk
+        time.sleep(self.latency)
+        for token in self._tokens():
+            time.sleep(self.token_delay)
+            yield AIMessageChunk(content=token)
+
+
+class MockChatPool:
+    def __init__(self, chat):
+        self.chat = chat
+
+    def get(self, api_key, model, temperature):
+        return self.chat
+
+    def warm_up(self, api_key, models):
+        pass
+
+
+def summarize(seconds):
+    values = sorted(v * 1000 for v in seconds)
+    if not values:
+        return {}
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(q * len(values)))], 3)
+
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values), 3),
+        'p50_ms': pick(0.50),
+        'p95_ms': pick(0.95),
+        'p99_ms': pick(0.99),
+        'max_ms': round(values[-1], 3),
+    }
+
+
+def peak_rss_mb(who):
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def new_system(cache_dir):
+    config.DOCUMENT_CACHE_DIR = cache_dir
+    config.RATE_LIMIT_TPM = 10 ** 9
+    from rag_system import RAGSystem
+    return RAGSystem()
+
+
+def ingest_child(pdf_path, cache_dir, start_method=None):
+    if start_method:
+        multiprocessing.set_start_method(start_method, force=True)
+    rag_system = new_system(cache_dir)
+    rag_system.count_tokens("")
+    start = time.perf_counter()
+    pages = rag_system.process_pdf(pdf_path)
+    cold = time.perf_counter() - start
+
+    # Same PDF without the document cache: the extraction pool is already running
+    rag_system = new_system(cache_dir + "_warm")
+    start = time.perf_counter()
+    rag_system.process_pdf(pdf_path)
+    warm = time.perf_counter() - start
+
+    import pdf_extract
+    rag_system = new_system(cache_dir)
+    start = time.perf_counter()
+    rag_system.process_pdf(pdf_path)
+    cached = time.perf_counter() - start
+
+    print(json.dumps({
+        'pages': pages,
+        'start_method': pdf_extract.start_method(),
+        'seconds': round(cold, 4),
+        'pages_per_sec': round(pages / cold, 1),
+        'warm_seconds': round(warm, 4),
+        'warm_pages_per_sec': round(pages / warm, 1),
+        'cached_load_ms': round(cached * 1000, 3),
+        'peak_rss_mb': peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        'worker_peak_rss_mb': (peak_rss_mb(resource.RUSAGE_CHILDREN) or None) if resource else None,
+    }))
+
+
+def bench_ingest(pdf_path, cache_dir, start_method=None):
+    command = [sys.executable, os.path.abspath(__file__), "--ingest-child", pdf_path, "--cache-dir", cache_dir]
+    if start_method:
+        command += ["--start-method", start_method]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def bench_retrieval(rag_system, questions, max_tokens):
+    latencies = []
+    for question in questions:
+        start = time.perf_counter()
+        rag_system.get_context_for_query(question, max_tokens)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies)
+
+
+def bench_query(rag_system, questions, mock):
+    latencies, first_tokens = [], []
+    for question in questions:
+        rag_system.answer_cache.clear()
+        start = time.perf_counter()
+        rag_system.query(question, "sk-bench")
+        latencies.append(time.perf_counter() - start)
+
+        rag_system.answer_cache.clear()
+        start = time.perf_counter()
+        stream = rag_system.query_stream(question, "sk-bench")
+        next(stream)
+        first_tokens.append(time.perf_counter() - start)
+        for _ in stream:
+            pass
+
+    mock_seconds = mock.latency + mock.token_delay * mock.answer_tokens
+    result = summarize(latencies)
+    result['overhead'] = summarize([latency - mock_seconds for latency in latencies])
+    result['stream_first_token'] = summarize(first_tokens)
+    return result
+
+
+def bench_throughput(rag_system, questions):
+    async def run():
+        try:
+            return await asyncio.gather(*(rag_system.aquery(question, "sk-bench") for question in questions))
+        finally:
+            await rag_system.chat_clients.aclose()
+
+    rag_system.answer_cache.clear()
+    start = time.perf_counter()
+    answers = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    return {
+        'queries': len(questions),
+        'concurrency': rag_system.max_concurrency,
+        'errors': sum(answer.startswith("API Hatası") for answer in answers),
+        'seconds': round(elapsed, 4),
+        'queries_per_sec': round(len(questions) / elapsed, 2),
+    }
+
+
+def start_mock_server(mock):
+    from mock_openai import create_mock_server
+    server = create_mock_server(
+        port=0,
+        latency_ms=mock.latency * 1000,
+        tokens_per_sec=1 / mock.token_delay if mock.token_delay else 0,
+        answer_tokens=mock.answer_tokens
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def flatten(results):
+    flat = {}
+    for entry in results['ingest']:
+        for key in ('pages_per_sec', 'warm_pages_per_sec', 'cached_load_ms', 'peak_rss_mb'):
+            if entry.get(key) is not None:
+                flat[f"ingest.{entry['pages']}.{key}"] = entry[key]
+        for key in ('pages_per_sec', 'warm_pages_per_sec'):
+            if entry.get('spawn', {}).get(key) is not None:
+                flat[f"ingest.{entry['pages']}.spawn.{key}"] = entry['spawn'][key]
+    for pages, stats in results['retrieval'].items():
+        for key in ('p50_ms', 'p95_ms'):
+            flat[f"retrieval.{pages}.{key}"] = stats[key]
+    for key in ('p50_ms', 'p95_ms'):
+        flat[f"query.overhead.{key}"] = results['query']['overhead'][key]
+        flat[f"query.stream_first_token.{key}"] = results['query']['stream_first_token'][key]
+    if 'throughput' in results:
+        flat["throughput.queries_per_sec"] = results['throughput']['queries_per_sec']
+    return flat
+
+
+def compare(results, baseline, tolerance, min_delta_ms=1.0):
+    current, previous = flatten(results), flatten(baseline)
+    regressions = []
+    for name, old in previous.items():
+        new = current.get(name)
+        if new is None or not old:
+            continue
+        if name.endswith("_ms") and abs(new - old) < min_delta_ms:
+            continue
+        change = (new - old) / old
+        if name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        if change > tolerance:
+            regressions.append({'metric': name, 'baseline': old, 'current': new, 'change': round(change, 3)})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="R.A.G PDF Asistanı performans ölçümleri")
+    parser.add_argument("--pages", default="50,200,1000", help="Virgülle ayrılmış sentetik PDF sayfa sayıları")
+    parser.add_argument("--words-per-page", type=int, default=350)
+    parser.add_argument("--queries", type=int, default=200, help="Arama gecikmesi için soru sayısı")
+    parser.add_argument("--max-tokens", type=int, default=config.MAX_CONTEXT_TOKENS)
+    parser.add_argument("--e2e-queries", type=int, default=30)
+    parser.add_argument("--llm-latency-ms", type=float, default=50)
+    parser.add_argument("--llm-token-ms", type=float, default=1)
+    parser.add_argument("--llm-answer-tokens", type=int, default=100)
+    parser.add_argument("--mock-server", action="store_true",
+                        help="Sahte LLM'i yerel OpenAI uyumlu HTTP sunucusu üzerinden çalıştır (gerçek istemci yığını)")
+    parser.add_argument("--throughput-queries", type=int, default=64, help="--mock-server ile eşzamanlı sorgu sayısı")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası (varsayılan: stdout)")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen göreli kötüleşme")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Bundan küçük süre farkları yok sayılır")
+    parser.add_argument("--ingest-child", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--start-method", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.ingest_child:
+        ingest_child(args.ingest_child, args.cache_dir, args.start_method)
+        return 0
+
+    sizes = [int(size) for size in args.pages.split(",") if size]
+    questions = sample_questions(args.queries)
+    results = {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'extract_workers': config.PDF_EXTRACT_WORKERS,
+            'max_tokens': args.max_tokens,
+        },
+        'ingest': [],
+        'retrieval': {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in sizes:
+            pdf_path = write_pdf(os.path.join(tmp, f"synthetic_{pages}.pdf"), pages, args.words_per_page)
+            cache_dir = os.path.join(tmp, f"cache_{pages}")
+            entry = bench_ingest(pdf_path, cache_dir)
+            results['ingest'].append(entry)
+            print(f"ingest {pages} sayfa: {entry['pages_per_sec']} sayfa/sn, tepe RSS {entry['peak_rss_mb']} MB", file=sys.stderr)
+            if entry['start_method'] != "spawn" and "spawn" in multiprocessing.get_all_start_methods():
+                # Windows and macOS start extraction workers with spawn
+                entry['spawn'] = bench_ingest(pdf_path, os.path.join(tmp, f"cache_{pages}_spawn"), "spawn")
+                print(f"ingest {pages} sayfa (spawn): ilk {entry['spawn']['pages_per_sec']} sayfa/sn, "
+                      f"sıcak havuz {entry['spawn']['warm_pages_per_sec']} sayfa/sn", file=sys.stderr)
+
+            rag_system = new_system(cache_dir)
+            rag_system.process_pdf(pdf_path)
+            stats = bench_retrieval(rag_system, questions, args.max_tokens)
+            results['retrieval'][str(pages)] = stats
+            print(f"arama {pages} sayfa: p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms", file=sys.stderr)
+
+        mock = MockChat(args.llm_latency_ms / 1000, args.llm_token_ms / 1000, args.llm_answer_tokens)
+        server = None
+        if args.mock_server:
+            from llm_client import ChatClientPool
+            server = start_mock_server(mock)
+            rag_system.chat_clients = ChatClientPool(server.base_url)
+        else:
+            rag_system.chat_clients = MockChatPool(mock)
+        results['meta']['llm'] = "http" if server else "in-process"
+
+        results['query'] = bench_query(rag_system, sample_questions(args.e2e_queries, seed=2), mock)
+        print(f"sorgu: p50 {results['query']['p50_ms']} ms, ek yük p50 {results['query']['overhead']['p50_ms']} ms", file=sys.stderr)
+
+        if server is not None:
+            results['throughput'] = bench_throughput(rag_system, sample_questions(args.throughput_queries, seed=3))
+            print(f"verim: {results['throughput']['queries_per_sec']} sorgu/sn", file=sys.stderr)
+            server.shutdown()
+            server.server_close()
+
+    status = 0
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            results['regressions'] = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+        for regression in results['regressions']:
+            print(f"GERİLEME {regression['metric']}: {regression['baseline']} -> {regression['current']}", file=sys.stderr)
+        status = 1 if results['regressions'] else 0
+
+    payload = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import random
+import textwrap
+
+VOCABULARY = (
+    "kumanda pil menu ayar ekran parlaklik kontrast kanal ses guc tus baglanti kablo kablosuz ag "
+    "guncelleme yazilim sifirlama fabrika garanti temizlik bakim filtre kapak sicaklik zamanlayici "
+    "program mod uyari hata kodu isik gosterge sarj adaptor priz sigorta montaj vida duvar ayak "
+    "kurulum baslangic kilit cocuk guvenlik enerji tasarruf bekleme uzaktan uygulama eslestirme"
+).split()
+
+LINE_WIDTH = 90
+LINES_PER_PAGE = 60
+
+
+def page_text(page_num, words_per_page, rng):
+    words = [rng.choice(VOCABULARY) for _ in range(words_per_page)]
+    words[rng.randrange(len(words))] = f"KOD{page_num:05d}"
+    return " ".join(words)
+
+
+def _escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _content_stream(text):
+    lines = textwrap.wrap(text, LINE_WIDTH)[:LINES_PER_PAGE]
+    parts = ["BT /F1 10 Tf 40 800 Td 12 TL"]
+    parts.extend(f"({_escape(line)}) Tj T*" for line in lines)
+    parts.append("ET")
+    return "\n".join(parts).encode('latin-1')
+
+
+def write_pdf(path, pages, words_per_page=350, seed=0):
+    rng = random.Random(seed)
+    page_ids = [4 + 2 * i for i in range(pages)]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {pages} >>".encode('ascii'),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    for i, pid in enumerate(page_ids):
+        stream = _content_stream(page_text(i + 1, words_per_page, rng))
+        objects[pid] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {pid + 1} 0 R >>"
+        ).encode('ascii')
+        objects[pid + 1] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+
+    with open(path, 'wb') as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = {}
+        for obj_id in sorted(objects):
+            offsets[obj_id] = f.tell()
+            f.write(b"%d 0 obj\n" % obj_id + objects[obj_id] + b"\nendobj\n")
+        xref = f.tell()
+        size = max(objects) + 1
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+        for obj_id in range(1, size):
+            f.write(b"%010d 00000 n \n" % offsets[obj_id])
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref))
+    return path
+
+
+def sample_questions(count, seed=1):
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(VOCABULARY, 3)) + " nasil yapilir" for _ in range(count)]
@@ -15,7 +15,7 @@ version.regex = __version__ = ['"](.*)['"]
 version.filename = %(source.dir)s/version.json
 
 # Gereksinimler
-requirements = python3,kivy,openai,langchain,langchain-community,langchain-openai,requests,PyPDF2,python-dotenv,gtts
+requirements = python3,kivy,numpy,openai,langchain,langchain-community,langchain-openai,requests,PyPDF2,python-dotenv,gtts
 
 # İzinler
 android.permissions = INTERNET,READ_EXTERNAL_STORAGE,WRITE_EXTERNAL_STORAGE
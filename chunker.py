@@ -0,0 +1,25 @@
+import re
+
+WORD_PATTERN = re.compile(r"\S+")
+
+
+def chunk_spans(text, text_tokens, chunk_tokens, overlap_tokens=0):
+    if chunk_tokens <= 0 or text_tokens <= chunk_tokens:
+        return [(0, len(text))]
+
+    words = [match.span() for match in WORD_PATTERN.finditer(text)]
+    if not words:
+        return [(0, len(text))]
+
+    tokens_per_word = text_tokens / len(words)
+    words_per_chunk = max(1, int(chunk_tokens / tokens_per_word))
+    overlap_words = max(0, min(words_per_chunk - 1, int(overlap_tokens / tokens_per_word)))
+    step = words_per_chunk - overlap_words
+
+    spans = []
+    for first in range(0, len(words), step):
+        last = min(first + words_per_chunk, len(words)) - 1
+        spans.append((words[first][0], words[last][1]))
+        if last == len(words) - 1:
+            break
+    return spans
@@ -4,9 +4,35 @@ from dotenv import load_dotenv
 load_dotenv()
 
 API_KEY = os.getenv("OPENAI_API_KEY", "")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
 
 TTS_ENGINE = "openai"
 TTS_LOCAL_RATE = 150
+TTS_CACHE_DIR = os.getenv("RAG_TTS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".rag_pdf_assistant", "audio"))
+TTS_CACHE_MAX_MB = int(os.getenv("RAG_TTS_CACHE_MAX_MB", "128"))
+
+DOCUMENT_CACHE_DIR = os.getenv("RAG_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".rag_pdf_assistant", "documents"))
+DOCUMENT_CACHE_MAX_MB = int(os.getenv("RAG_CACHE_MAX_MB", "512"))
+MAX_RESIDENT_DOCUMENTS = int(os.getenv("RAG_MAX_RESIDENT_DOCUMENTS", "8"))
+
+ANSWER_CACHE_SIZE = int(os.getenv("RAG_ANSWER_CACHE_SIZE", "256"))
+ANSWER_CACHE_TTL_SECONDS = int(os.getenv("RAG_ANSWER_CACHE_TTL", "3600"))
+ANSWER_CACHE_SIMILARITY = float(os.getenv("RAG_ANSWER_CACHE_SIMILARITY", "1.0"))
+
+ASYNC_MAX_CONCURRENCY = int(os.getenv("RAG_ASYNC_MAX_CONCURRENCY", "8"))
+
+SERVER_DOCUMENT_ROOT = os.getenv("RAG_SERVER_DOCUMENT_ROOT", os.getcwd())
+SERVER_TOKEN = os.getenv("RAG_SERVER_TOKEN", "")
+
+RATE_LIMIT_TPM = int(os.getenv("RAG_RATE_LIMIT_TPM", "30000"))
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RAG_RATE_LIMIT_MAX_WAIT", "10"))
+RATE_LIMIT_MIN_CONTEXT_TOKENS = int(os.getenv("RAG_RATE_LIMIT_MIN_CONTEXT_TOKENS", "8000"))
+RATE_LIMIT_ANSWER_TOKENS = int(os.getenv("RAG_RATE_LIMIT_ANSWER_TOKENS", "1000"))
+OPENAI_TIMEOUT = float(os.getenv("RAG_OPENAI_TIMEOUT", "600"))
+RATE_LIMIT_RETRIES = int(os.getenv("RAG_RATE_LIMIT_RETRIES", "4"))
+TRANSIENT_RETRIES = int(os.getenv("RAG_TRANSIENT_RETRIES", "2"))
+
+TRACE_FILE = os.getenv("RAG_TRACE_FILE", "")
 
 try:
     from platform_config import (
@@ -25,6 +51,16 @@ except ImportError:
     IS_WINDOWS = True
     IS_ANDROID = False
 
+CHUNK_TOKENS = int(os.getenv("RAG_CHUNK_TOKENS", "400"))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("RAG_CHUNK_OVERLAP_TOKENS", "60"))
+
+EMBEDDING_DIM = int(os.getenv("RAG_EMBEDDING_DIM", "512"))
+HYBRID_EMBEDDING_WEIGHT = float(os.getenv("RAG_HYBRID_EMBEDDING_WEIGHT", "0.4"))
+EMBEDDING_MIN_SIMILARITY = float(os.getenv("RAG_EMBEDDING_MIN_SIMILARITY", "0.2"))
+RETRIEVAL_RELATIVE_CUTOFF = float(os.getenv("RAG_RETRIEVAL_RELATIVE_CUTOFF", "0.25"))
+
+PDF_EXTRACT_WORKERS = int(os.getenv("RAG_EXTRACT_WORKERS", "1" if IS_ANDROID else str(os.cpu_count() or 1)))
+
 COLOR_BG = "#18181B"
 COLOR_PANEL = "#27272A"
 COLOR_BORDER = "#3F3F46"
@@ -46,7 +82,7 @@ def save_api_key(key):
 def test_api_key(key):
     try:
         from openai import OpenAI
-        client = OpenAI(api_key=key)
+        client = OpenAI(api_key=key, base_url=OPENAI_BASE_URL)
         client.models.list()
         return True
     except:
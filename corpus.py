@@ -0,0 +1,228 @@
+import itertools
+import math
+import sys
+import threading
+from collections import OrderedDict
+import numpy as np
+import config
+from chunker import chunk_spans
+from embedding_index import HashedEmbeddingIndex
+from page_store import PageStore
+from search_index import BM25Index
+from text_analyzer import analyze
+
+PAGE_HEADER_TOKENS = 10
+DOCUMENT_HEADER = "\n\n=== BELGE: {} ==="
+SNAPSHOT_PARTS = ('pages', 'index', 'embeddings')
+
+
+def is_complete_snapshot(cached):
+    return isinstance(cached, dict) and all(cached.get(part) is not None for part in SNAPSHOT_PARTS)
+
+
+class Document:
+    def __init__(self, doc_id, name, path, cache_key, token_counter):
+        self.doc_id = doc_id
+        self.name = name
+        self.path = path
+        self.cache_key = cache_key
+        self.token_counter = token_counter
+        self.pages_loaded = 0
+        self.pages_total = 0
+        self.page_count = 0
+        self.is_loading = False
+        self.load_failed = False
+        self.reset()
+
+    @property
+    def is_resident(self):
+        return self.pages is not None
+
+    @property
+    def total_tokens(self):
+        return self.pages.total_tokens + len(self.pages) * PAGE_HEADER_TOKENS
+
+    def reset(self):
+        self.pages = PageStore()
+        self.index = BM25Index()
+        self.embeddings = HashedEmbeddingIndex(config.EMBEDDING_DIM)
+
+    def unload(self):
+        self.pages = None
+        self.index = None
+        self.embeddings = None
+
+    def add_page(self, page_num, page_text):
+        page_tokens = self.token_counter(page_text)
+        page_idx = self.pages.append(page_num, page_text, page_tokens)
+
+        spans = chunk_spans(page_text, page_tokens, config.CHUNK_TOKENS, config.CHUNK_OVERLAP_TOKENS)
+        for start, end in spans:
+            chunk_text = page_text[start:end]
+            chunk_tokens = page_tokens if len(spans) == 1 else self.token_counter(chunk_text)
+            self.pages.add_chunk(page_idx, start, end, chunk_tokens)
+            terms = analyze(chunk_text)
+            self.index.add_document(terms)
+            self.embeddings.add(terms)
+        self.page_count = len(self.pages)
+
+    def snapshot(self):
+        return {
+            'pages': self.pages,
+            'index': self.index,
+            'embeddings': self.embeddings
+        }
+
+    def restore(self, cached):
+        if not is_complete_snapshot(cached):
+            raise ValueError("Belge önbelleği eksik")
+        self.pages = cached['pages']
+        self.index = cached['index']
+        self.embeddings = cached['embeddings']
+        self.page_count = len(self.pages)
+        self.pages_total = self.pages_loaded = self.pages.page_nums[-1] if len(self.pages) else 0
+
+
+class Corpus:
+    def __init__(self, loader, max_resident=8, lock=None):
+        self.loader = loader
+        self.max_resident = max_resident
+        self.lock = lock or threading.Condition(threading.RLock())
+        self.documents = OrderedDict()
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.documents
+
+    def get(self, doc_id):
+        return self.documents.get(doc_id)
+
+    def add(self, document):
+        self.documents[document.doc_id] = document
+        self.documents.move_to_end(document.doc_id)
+        self._evict()
+
+    def remove(self, doc_id):
+        return self.documents.pop(doc_id, None)
+
+    def clear(self):
+        self.documents.clear()
+
+    def has_content(self):
+        return any(document.page_count for document in list(self.documents.values()))
+
+    def _selected(self, doc_ids):
+        if doc_ids is None:
+            return list(self.documents.values())
+        return [self.documents[doc_id] for doc_id in doc_ids if doc_id in self.documents]
+
+    def _load(self, document):
+        try:
+            self.loader(document)
+            return True
+        except Exception as e:
+            print(f"Belge yüklenemedi, atlanıyor: {document.name}: {e}", file=sys.stderr)
+            document.unload()
+            return False
+
+    def prefetch(self, doc_ids=None):
+        # Reloads evicted documents without holding the lock, so other readers are not blocked
+        with self.lock:
+            pending = [d for d in self._selected(doc_ids) if not d.is_resident and not d.is_loading]
+            for document in pending:
+                document.is_loading = True
+                document.load_failed = False
+
+        for document in pending:
+            staged = Document(document.doc_id, document.name, document.path, document.cache_key, document.token_counter)
+            loaded = self._load(staged)
+            with self.lock:
+                if loaded:
+                    document.restore(staged.snapshot())
+                document.load_failed = not loaded
+                document.is_loading = False
+                self.lock.notify_all()
+
+    def select(self, doc_ids=None):
+        with self.lock:
+            selected = self._selected(doc_ids)
+
+            loaded = []
+            for document in selected:
+                if not document.is_resident and document.is_loading:
+                    self.lock.wait_for(lambda: document.is_resident or not document.is_loading)
+                if not document.is_resident and (document.load_failed or not self._load(document)):
+                    continue
+                self.documents.move_to_end(document.doc_id)
+                loaded.append(document)
+            self._evict(keep=len(loaded))
+            return loaded
+
+    def _evict(self, keep=0):
+        limit = max(self.max_resident, keep)
+        resident = [d for d in self.documents.values() if d.is_resident]
+        for document in resident[:max(0, len(resident) - limit)]:
+            if not document.is_loading:
+                document.unload()
+
+    def rank_batch(self, keyword_lists, documents):
+        indexed = [document for document in documents if len(document.index)]
+        if not indexed:
+            for _ in keyword_lists:
+                yield []
+            return
+
+        n = sum(len(document.index) for document in indexed)
+        avg_length = sum(document.index.total_length for document in indexed) / n or 1.0
+        weight = config.HYBRID_EMBEDDING_WEIGHT
+        similarities = [
+            np.ascontiguousarray(document.embeddings.similarities_batch(keyword_lists).T) if weight > 0 else None
+            for document in indexed
+        ]
+        idf = {}
+
+        for q, keywords in enumerate(keyword_lists):
+            if not keywords:
+                yield []
+                continue
+
+            for term in set(keywords):
+                if term not in idf:
+                    df = sum(document.index.document_frequency(term) for document in indexed)
+                    idf[term] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+            keyword_hits = [document.index.search(keywords, idf=idf, avg_length=avg_length) for document in indexed]
+            top_score = max((hits[0][1] for hits in keyword_hits if hits), default=0.0)
+
+            ranked = []
+            scored = []
+            for document, hits, document_similarities in zip(indexed, keyword_hits, similarities):
+                if document_similarities is None:
+                    ranked.extend((score, document, chunk_idx) for chunk_idx, score in hits)
+                    continue
+
+                row = document_similarities[q]
+                fused = row * weight
+                candidates = row >= config.EMBEDDING_MIN_SIMILARITY
+
+                if hits:
+                    ids = np.fromiter((chunk_idx for chunk_idx, _ in hits), dtype=np.intp, count=len(hits))
+                    scores = np.fromiter((score for _, score in hits), dtype=np.float32, count=len(hits))
+                    fused[ids] += (1 - weight) * scores / top_score
+                    candidates[ids] = True
+
+                ids = np.flatnonzero(candidates)
+                if len(ids):
+                    scored.append((document, ids, fused[ids]))
+
+            # Weak matches far below the best one only pad the prompt
+            best = max((float(scores.max()) for _, _, scores in scored), default=0.0)
+            cutoff = best * config.RETRIEVAL_RELATIVE_CUTOFF
+            for document, ids, scores in scored:
+                keep = scores >= cutoff
+                ranked.extend(zip(scores[keep].tolist(), itertools.repeat(document), ids[keep].tolist()))
+
+            ranked.sort(key=lambda item: -item[0])
+            yield ranked
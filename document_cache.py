@@ -0,0 +1,75 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def evict_oldest(cache_dir, suffix, max_bytes):
+    try:
+        entries = []
+        for name in os.listdir(cache_dir):
+            if not name.endswith(suffix):
+                continue
+            path = os.path.join(cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+class DocumentCache:
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def make_key(self, content_hash, version):
+        return f"{content_hash}-v{version}"
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def load(self, key, validate=None):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            if validate is not None and not validate(data):
+                os.remove(path)
+                return None
+            os.utime(path)
+            return data
+        except Exception:
+            return None
+
+    def store(self, key, data):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        evict_oldest(self.cache_dir, ".pkl", self.max_bytes)
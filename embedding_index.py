@@ -0,0 +1,70 @@
+import math
+import zlib
+import numpy as np
+
+
+class HashedEmbeddingIndex:
+    def __init__(self, dim=512):
+        self.dim = dim
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._pending = []
+        self._word_features = {}
+
+    def __len__(self):
+        return self._matrix.shape[0] + len(self._pending)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_matrix'] = self.matrix
+        state['_pending'] = []
+        state['_word_features'] = {}
+        return state
+
+    @property
+    def matrix(self):
+        if self._pending:
+            self._matrix = np.vstack([self._matrix, *self._pending])
+            self._pending = []
+        return self._matrix
+
+    def _features(self, word):
+        features = self._word_features.get(word)
+        if features is None:
+            padded = f"<{word}>"
+            grams = [padded] + [padded[i:i + 3] for i in range(len(padded) - 2)]
+            hashes = np.array([zlib.crc32(gram.encode('utf-8')) for gram in grams], dtype=np.uint32)
+            signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+            features = ((hashes % self.dim).astype(np.intp), signs)
+            self._word_features[word] = features
+        return features
+
+    def embed(self, tokens):
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        if not counts:
+            return np.zeros(self.dim, dtype=np.float32)
+
+        indices = []
+        weights = []
+        for word, tf in counts.items():
+            word_indices, signs = self._features(word)
+            indices.append(word_indices)
+            weights.append(signs * (1.0 + math.log(tf)))
+
+        vector = np.bincount(
+            np.concatenate(indices), weights=np.concatenate(weights), minlength=self.dim
+        ).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def add(self, tokens):
+        self._pending.append(self.embed(tokens)[np.newaxis, :])
+        return len(self) - 1
+
+    def similarities_batch(self, token_lists):
+        matrix = self.matrix
+        if not matrix.shape[0] or not token_lists:
+            return np.zeros((matrix.shape[0], len(token_lists)), dtype=np.float32)
+        queries = np.vstack([self.embed(tokens) for tokens in token_lists])
+        return matrix @ queries.T
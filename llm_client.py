@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import weakref
+import httpx
+from langchain_openai import ChatOpenAI
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+# Same as the openai SDK default; the injected http client overrides the SDK's own timeout
+DEFAULT_TIMEOUT = 600.0
+
+
+class ChatClientPool:
+    def __init__(self, base_url=OPENAI_API_BASE, max_connections=20, keepalive_expiry=300.0, timeout=DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=5.0)
+        self._http_client = None
+        self._clients = {}
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def http_client(self):
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(limits=self.limits, timeout=self.timeout)
+            return self._http_client
+
+    def get(self, api_key, model, temperature):
+        key = (api_key, model, temperature)
+        chat = self._clients.get(key)
+        if chat is None:
+            http_client = self.http_client
+            with self._lock:
+                chat = self._clients.get(key)
+                if chat is None:
+                    chat = ChatOpenAI(
+                        openai_api_key=api_key,
+                        model_name=model,
+                        temperature=temperature,
+                        max_retries=0,
+                        stream_usage=True,
+                        openai_api_base=self.base_url,
+                        http_client=http_client
+                    )
+                    self._clients[key] = chat
+        return chat
+
+    def get_async(self, api_key, model, temperature):
+        loop = asyncio.get_running_loop()
+        http_client = self.http_client
+        key = (api_key, model, temperature)
+        with self._lock:
+            state = self._async_clients.get(loop)
+            if state is None:
+                state = {
+                    'http_client': httpx.AsyncClient(limits=self.limits, timeout=self.timeout),
+                    'clients': {}
+                }
+                self._async_clients[loop] = state
+            chat = state['clients'].get(key)
+            if chat is None:
+                chat = ChatOpenAI(
+                    openai_api_key=api_key,
+                    model_name=model,
+                    temperature=temperature,
+                    max_retries=0,
+                    stream_usage=True,
+                    openai_api_base=self.base_url,
+                    http_client=http_client,
+                    http_async_client=state['http_client']
+                )
+                state['clients'][key] = chat
+        return chat
+
+    async def aclose(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._async_clients.pop(loop, None)
+        if state is not None:
+            await state['http_client'].aclose()
+
+    def warm_up(self, api_key, models):
+        def run():
+            try:
+                for model, temperature in models:
+                    self.get(api_key, model, temperature)
+                self.http_client.get(
+                    f"{self.base_url}/models",
+                    headers={"Authorization": f"Bearer {api_key}"}
+                )
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
@@ -1,20 +1,22 @@
 import sys
 import os
+import multiprocessing
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTextEdit, QLineEdit, QPushButton, 
                              QLabel, QProgressBar, QFileDialog, QFrame, QCheckBox,
                              QDialog, QDialogButtonBox, QProgressDialog)
-from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QIcon, QColor, QPalette
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 import config
 from rag_system import RAGSystem
-from collections import deque
 from workers import LoadPDFWorker, QueryWorker, PersistentTTSWorker, SummaryWorker
 from visualizer import ThinkingVisualizer
 from audio_visualizer import SpeakingVisualizer
+from audio_player import PcmPlayer
 from dialogs import StyledMessageBox
+from tracing import tracer, NULL_SPAN
+from text_processor import SentenceSplitter
 
 class ApiKeyDialog(QDialog):
     def __init__(self, parent=None):
@@ -110,27 +112,30 @@ class MainWindow(QMainWindow):
         self.resize(1000, 800)
         self.rag_system = None
         self.tts_enabled = True
-        self.current_audio_file = None
-        self.audio_queue = deque()
+        self.query_active = False
         self.is_playing_audio = False
+        self.trace = NULL_SPAN
+        self.playback_span = NULL_SPAN
         self.setup_ui()
         self.setup_audio()
         
         self.tts_generation_queue = []
         self.is_generating_tts = False
         self.active_tts_worker = None
+        self.sentence_splitter = SentenceSplitter()
+        self.pipelined_tts = False
+        self.answer_streaming = False
+        self.answer_muted = False
+        self.pending_tts = 0
+        self.discard_tts = 0
         
         QTimer.singleShot(100, self.init_system)
 
     def setup_audio(self):
-        self.media_player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.media_player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(1.0)
-        
-        self.media_player.playbackStateChanged.connect(self.on_playback_state_changed)
-        self.media_player.errorOccurred.connect(self.on_media_error)
-        self.media_player.mediaStatusChanged.connect(self.on_media_status_changed)
+        self.audio_player = PcmPlayer(self)
+        self.audio_player.started.connect(self.on_playback_started)
+        self.audio_player.finished.connect(self.on_playback_finished)
+        self.audio_player.error.connect(self.on_media_error)
         
         self.persistent_tts = PersistentTTSWorker()
         self.persistent_tts.finished.connect(self.on_persistent_tts_finished)
@@ -385,6 +390,7 @@ class MainWindow(QMainWindow):
         QApplication.processEvents()
         try:
             self.rag_system = RAGSystem()
+            self.rag_system.warm_up(config.API_KEY)
             self.lbl_status.setText("Hazır")
             self.btn_load.setEnabled(True)
             self.add_log("SİSTEM", "Asistan aktif. Sohbet etmek için bir PDF belgesi yükleyin.")
@@ -425,31 +431,49 @@ class MainWindow(QMainWindow):
             self.add_log("SİSTEM", f"'{os.path.basename(fname)}' analizi başlatıldı, lütfen bekleyin...")
 
             self.loader_thread = LoadPDFWorker(self.rag_system, fname)
+            self.partial_ready = False
             self.loader_thread.progress.connect(self.progress.setValue)
+            self.loader_thread.pages_ready.connect(self.on_pdf_pages_ready)
             self.loader_thread.finished.connect(self.on_pdf_loaded)
             self.loader_thread.error.connect(lambda e: self.add_log("HATA", e))
             self.loader_thread.start()
 
+    def on_pdf_pages_ready(self, loaded, total):
+        if not self.partial_ready:
+            self.partial_ready = True
+            if not self.query_active:
+                self.btn_send.setEnabled(True)
+                self.input_field.setEnabled(True)
+                self.input_field.setFocus()
+            self.add_log("SİSTEM", "İlk sayfalar hazır. Yükleme sürerken soru sorabilirsiniz.")
+        if not self.query_active:
+            self.lbl_status.setText(f"İşleniyor... {loaded}/{total} sayfa sorgulanabilir")
+
     def on_pdf_loaded(self, chunk_count):
         self.progress.setValue(100)
-        self.lbl_status.setText("Hazır")
         self.btn_load.setEnabled(True)
-        self.btn_send.setEnabled(True)
-        self.input_field.setEnabled(True)
-        self.input_field.setFocus()
-        self.add_log("SİSTEM", f"Analiz tamamlandı. {chunk_count} veri parçası belleğe alındı.")
+        if not self.query_active:
+            self.lbl_status.setText("Hazır")
+            self.btn_send.setEnabled(True)
+            self.input_field.setEnabled(True)
+            self.input_field.setFocus()
+        document_count = len(self.rag_system.list_documents())
+        self.add_log("SİSTEM", f"Analiz tamamlandı. {chunk_count} veri parçası belleğe alındı. (Toplam {document_count} belge)")
         QTimer.singleShot(1500, lambda: self.progress.setValue(0))
 
     def send_query(self):
         text = self.input_field.text().strip()
-        if not text:
+        if not text or self.query_active:
             return
         self.input_field.clear()
         self.add_log("SEN", text)
+        self.trace.end()
+        self.trace = tracer.begin("request", tts=self.tts_enabled)
         self.start_thinking_mode(text)
 
     def start_thinking_mode(self, question):
         self.last_question = question
+        self.query_active = True
         self.input_field.setEnabled(False)
         self.btn_send.setEnabled(False)
         self.btn_send.setText("...")
@@ -457,16 +481,23 @@ class MainWindow(QMainWindow):
         self.thinking_viz.setVisible(True)
         self.thinking_viz.start_animation()
         
-        self.worker = QueryWorker(self.rag_system, question)
+        self.worker = QueryWorker(self.rag_system, question, trace_id=self.trace.trace_id)
         self.worker.finished.connect(self.on_query_result)
-        self.worker.error.connect(lambda e: self.add_log("HATA", e))
+        self.worker.error.connect(self.on_query_error)
         self.worker.token_received.connect(self.on_token_received)
         
         self.add_log("ASİSTAN", "")
         self.current_message_buffer = ""
+        self.begin_answer()
         
         self.worker.start()
 
+    def begin_answer(self):
+        self.sentence_splitter = SentenceSplitter()
+        self.pipelined_tts = self.tts_enabled and not self.summary_checkbox.isChecked()
+        self.answer_streaming = True
+        self.answer_muted = False
+
     def on_token_received(self, token):
         self.current_message_buffer += token
         cursor = self.chat_area.textCursor()
@@ -474,6 +505,9 @@ class MainWindow(QMainWindow):
         cursor.insertText(token)
         sb = self.chat_area.verticalScrollBar()
         sb.setValue(sb.maximum())
+        if self.pipelined_tts and not self.answer_muted:
+            for sentence in self.sentence_splitter.feed(token):
+                self.on_sentence_ready(sentence)
 
     def on_sentence_ready(self, sentence):
         try:
@@ -489,70 +523,54 @@ class MainWindow(QMainWindow):
         self.btn_send.setText("GÖNDER")
 
     def process_tts_queue(self):
-        try:
-            if not self.tts_generation_queue:
-                return
+        while self.tts_generation_queue:
+            sentence = self.tts_generation_queue.pop(0)
+            if any(c.isalnum() for c in sentence):
+                self.speak(sentence)
 
-            if self.is_generating_tts:
-                if self.active_tts_worker is None or not self.active_tts_worker.isRunning():
-                     self.is_generating_tts = False
-                else:
-                     return
+    def speak(self, text):
+        self.pending_tts += 1
+        self.persistent_tts.speak(text, self.trace.trace_id)
 
-            self.is_generating_tts = True
-            sentence = self.tts_generation_queue.pop(0)
+    def speech_in_progress(self):
+        streaming_speech = self.pipelined_tts and self.answer_streaming and not self.answer_muted
+        return self.pending_tts > 0 or self.is_playing_audio or streaming_speech
 
-            self.persistent_tts.speak(sentence)
-            self.is_generating_tts = False
-            self.process_tts_queue()
+    def on_persistent_tts_finished(self, pcm):
+        if self.discard_tts:
+            self.discard_tts -= 1
             return
-            
-        except Exception as e:
-            self.is_generating_tts = False
-            self.process_tts_queue()
-
-    def on_persistent_tts_finished(self, file_path):
-        if file_path and os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-            self.queue_audio(file_path)
+        if self.answer_muted:
+            return
+        self.pending_tts = max(0, self.pending_tts - 1)
+        if pcm is not None and pcm.frames > 0:
+            self.queue_audio(pcm)
         else:
-            self.add_log("HATA", "Ses dosyası oluşturulamadı veya boş")
-            self.reset_ui()
+            self.add_log("HATA", "Ses verisi oluşturulamadı veya boş")
+            if not self.speech_in_progress():
+                self.finish_speaking()
 
-    def on_tts_generated(self, file_path, sentence):
-        self.is_generating_tts = False
-        self.active_tts_worker = None
-        if file_path and os.path.exists(file_path):
-            self.queue_audio(file_path)
-        self.process_tts_queue()
-
-    def queue_audio(self, file_path):
-        self.audio_queue.append(file_path)
-        if not self.is_playing_audio:
-            self.is_playing_audio = True
-            self.play_next_in_queue()
-
-    def play_next_in_queue(self):
-        if not self.audio_queue:
-            self.is_playing_audio = False
-            self.reset_ui()
-            return
-        
+    def queue_audio(self, pcm):
         try:
-            self.is_playing_audio = True
-            file_path = self.audio_queue.popleft()
-            
-            if not file_path or not os.path.exists(file_path):
-                self.add_log("HATA", f"Ses dosyası bulunamadı: {file_path}")
-                self.play_next_in_queue()
-                return
-            
-            self.play_audio(file_path)
+            if not self.is_playing_audio:
+                self.is_playing_audio = True
+                self.show_speaking()
+            self.audio_player.enqueue(pcm)
         except Exception as e:
             self.add_log("HATA", f"Ses çalma hatası: {str(e)}")
             self.is_playing_audio = False
-            self.reset_ui()
+            self.finish_speaking()
+
+    def on_query_error(self, error):
+        self.add_log("HATA", error)
+        self.answer_streaming = False
+        self.thinking_viz.stop_animation()
+        self.thinking_viz.setVisible(False)
+        if not self.speech_in_progress():
+            self.finish_speaking()
 
     def on_query_result(self, result):
+        self.answer_streaming = False
         self.thinking_viz.stop_animation()
         self.thinking_viz.setVisible(False)
         self.btn_send.setText("GÖNDER")
@@ -576,10 +594,15 @@ class MainWindow(QMainWindow):
                 self.add_log("SİSTEM", "Sorgu iptal edildi.")
             return
         
-        if self.tts_enabled:
-             self.start_tts(result)
+        if self.answer_muted or not self.tts_enabled:
+            self.reset_ui()
+        elif self.pipelined_tts:
+            for sentence in self.sentence_splitter.flush():
+                self.on_sentence_ready(sentence)
+            if not self.speech_in_progress():
+                self.finish_speaking()
         else:
-             self.reset_ui()
+            self.start_tts(result)
 
     
     def query_with_chatgpt(self):
@@ -588,56 +611,74 @@ class MainWindow(QMainWindow):
             self.reset_ui()
             return
         
+        self.query_active = True
         self.input_field.setEnabled(False)
         self.btn_send.setEnabled(False)
         self.thinking_viz.setVisible(True)
         self.thinking_viz.start_animation()
         
-        self.worker = QueryWorker(self.rag_system, self.last_question, mode="general")
+        self.worker = QueryWorker(self.rag_system, self.last_question, mode="general", trace_id=self.trace.trace_id)
         self.worker.finished.connect(self.on_query_result)
-        self.worker.error.connect(lambda e: self.add_log("HATA", e))
+        self.worker.error.connect(self.on_query_error)
         self.worker.token_received.connect(self.on_token_received)
         
         self.add_log("ASİSTAN", "")
         self.current_message_buffer = ""
+        self.begin_answer()
         
         self.worker.start()
 
     def start_tts(self, text):
         if self.summary_checkbox.isChecked():
             self.lbl_status.setText("Özetleniyor...")
-            self.summary_worker = SummaryWorker(self.rag_system, text)
+            self.summary_worker = SummaryWorker(self.rag_system, text, trace_id=self.trace.trace_id)
             self.summary_worker.finished.connect(lambda summary: self.on_summary_ready(summary))
             self.summary_worker.error.connect(self.on_summary_error)
             self.summary_worker.start()
         else:
             self.lbl_status.setText("Seslendiriliyor...")
-            self.persistent_tts.speak(text)
+            self.speak(text)
 
     def on_summary_ready(self, summary_text):
         self.lbl_status.setText("Özet okunuyor...")
-        self.persistent_tts.speak(summary_text)
+        self.speak(summary_text)
     
     def on_summary_error(self, error):
         self.add_log("HATA", f"Özetleme hatası: {error}")
         self.reset_ui()
 
-    def play_audio(self, file_path):
+    def show_speaking(self):
         self.tts_progress_bar.setVisible(False)
-        self.current_audio_file = file_path
         self.lbl_status.setText("Yanıtlanıyor...")
         self.thinking_viz.setVisible(False)
-        self.audio_viz.set_audio_data(file_path)
+        self.audio_viz.set_source(self.audio_player)
         self.audio_viz.setVisible(True)
         self.btn_send.setVisible(False)
         self.btn_stop.setVisible(True)
-        self.media_player.setSource(QUrl.fromLocalFile(file_path))
-        self.media_player.play()
+        self.playback_span = tracer.span("playback_start", self.trace.trace_id)
+
+    def finish_speaking(self):
+        self.audio_player.stop()
+        self.audio_viz.stop()
+        self.audio_viz.setVisible(False)
+        self.reset_ui()
         
     def stop_speaking(self):
-        self.audio_queue.clear()
         self.is_playing_audio = False
-        self.media_player.stop()
+        self.answer_muted = True
+        self.audio_player.stop()
+        self.discard_pending_speech()
+        self.audio_viz.stop()
+        self.audio_viz.setVisible(False)
+        if self.answer_streaming:
+            self.btn_stop.setVisible(False)
+            self.btn_send.setVisible(True)
+            return
+        self.thinking_viz.stop_animation()
+        self.thinking_viz.setVisible(False)
+        self.reset_ui()
+
+    def discard_pending_speech(self):
         self.tts_generation_queue = []
         self.is_generating_tts = False
         try:
@@ -645,38 +686,27 @@ class MainWindow(QMainWindow):
                 try:
                     self.persistent_tts.queue.get_nowait()
                     self.persistent_tts.queue.task_done()
+                    self.pending_tts -= 1
                 except:
                     break
         except:
             pass
-        self.audio_viz.stop()
-        self.audio_viz.setVisible(False)
-        self.thinking_viz.stop_animation()
-        self.thinking_viz.setVisible(False)
-        self.reset_ui()
+        self.discard_tts += max(0, self.pending_tts)
+        self.pending_tts = 0
 
-    def on_playback_state_changed(self, state):
-        if state == QMediaPlayer.PlaybackState.StoppedState:
-            self.audio_viz.stop()
-            self.audio_viz.setVisible(False)
-            if self.current_audio_file and os.path.exists(self.current_audio_file):
-                try:
-                    os.remove(self.current_audio_file)
-                except:
-                    pass
-                self.current_audio_file = None
-            if self.is_playing_audio:
-                self.play_next_in_queue()
-            else:
-                self.reset_ui()
+    def on_playback_started(self):
+        self.playback_span.end()
+        self.trace.end()
+
+    def on_playback_finished(self):
+        self.is_playing_audio = False
+        if not self.speech_in_progress():
+            self.finish_speaking()
 
-    def on_media_error(self, error, error_string):
+    def on_media_error(self, error_string):
         self.add_log("HATA", f"Ses çalma hatası: {error_string}")
         self.stop_speaking()
-    
-    def on_media_status_changed(self, status):
-        pass
-        
+
     def update_visualizer_from_timer(self):
         pass
 
@@ -684,18 +714,26 @@ class MainWindow(QMainWindow):
         self.tts_progress_bar.setVisible(False)
         self.add_log("HATA", f"Ses hatası: {error}")
         
-        self.tts_generation_queue = []
-        self.is_generating_tts = False
+        if self.discard_tts:
+            self.discard_tts -= 1
+        else:
+            self.pending_tts = max(0, self.pending_tts - 1)
+        self.answer_muted = True
+        self.discard_pending_speech()
         self.active_tts_worker = None
-        self.audio_queue.clear()
+        self.audio_player.stop()
         self.is_playing_audio = False
-        self.thinking_viz.stop_animation()
-        self.thinking_viz.setVisible(False)
         self.audio_viz.stop()
         self.audio_viz.setVisible(False)
+        if self.answer_streaming:
+            return
+        self.thinking_viz.stop_animation()
+        self.thinking_viz.setVisible(False)
         self.reset_ui()
 
     def reset_ui(self):
+        self.trace.end()
+        self.query_active = False
         self.input_field.setEnabled(True)
         self.btn_send.setEnabled(True)
         self.btn_send.setVisible(True)
@@ -705,6 +743,7 @@ class MainWindow(QMainWindow):
         self.lbl_status.setText("Hazır")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     font = QFont("Segoe UI", 10)
     app.setFont(font)
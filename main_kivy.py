@@ -48,6 +48,7 @@ class PDFAssistantApp(App):
         self.title = "PDF Asistanı"
         self.rag_system = None
         self.tts_enabled = True
+        self.query_active = False
         self.audio_queue = deque()
         self.is_playing_audio = False
         self.persistent_tts = None
@@ -166,6 +167,7 @@ class PDFAssistantApp(App):
     def init_system(self, dt):
         try:
             self.rag_system = RAGSystem()
+            self.rag_system.warm_up(config.API_KEY)
             self.update_status("Hazır")
             self.btn_load.disabled = False
             self.add_message("SİSTEM", "✅ Asistan hazır. PDF yükleyin.", "#A1A1AA")
@@ -276,13 +278,15 @@ class PDFAssistantApp(App):
         self.update_status("⏳ PDF işleniyor...")
         self.btn_load.disabled = True
         self.btn_send.disabled = True
+        self.partial_ready = False
         self.add_message("SİSTEM", f"📄 {os.path.basename(pdf_path)} yükleniyor...", "#38BDF8")
         
         def load_thread():
             try:
                 count = self.rag_system.process_pdf(
                     pdf_path,
-                    lambda x: Clock.schedule_once(lambda dt: self.update_progress(x), 0)
+                    lambda x: Clock.schedule_once(lambda dt: self.update_progress(x), 0),
+                    lambda loaded, total: Clock.schedule_once(lambda dt: self.on_pdf_pages_ready(loaded, total), 0)
                 )
                 Clock.schedule_once(lambda dt: self.on_pdf_loaded(count), 0)
             except Exception as e:
@@ -291,6 +295,13 @@ class PDFAssistantApp(App):
         
         Thread(target=load_thread, daemon=True).start()
     
+    @mainthread
+    def on_pdf_pages_ready(self, loaded, total):
+        if not self.partial_ready:
+            self.partial_ready = True
+            self.btn_send.disabled = self.query_active
+        self.update_status(f"⏳ {loaded}/{total} sayfa hazır")
+    
     @mainthread
     def update_progress(self, value):
         self.progress.value = value
@@ -299,7 +310,7 @@ class PDFAssistantApp(App):
     def on_pdf_loaded(self, count):
         self.update_progress(100)
         self.btn_load.disabled = False
-        self.btn_send.disabled = False
+        self.btn_send.disabled = self.query_active
         
         if count > 0:
             self.update_status("✅ Hazır")
@@ -312,11 +323,12 @@ class PDFAssistantApp(App):
     
     def send_query(self, instance=None):
         text = self.input_field.text.strip()
-        if not text or not self.rag_system:
+        if not text or not self.rag_system or self.query_active:
             return
         
         self.input_field.text = ""
         self.add_message("SEN", text, "#38BDF8")
+        self.query_active = True
         self.btn_send.disabled = True
         self.update_status("🤔 Düşünüyor...")
         
@@ -337,6 +349,7 @@ class PDFAssistantApp(App):
     
     @mainthread
     def reset_ui(self):
+        self.query_active = False
         self.btn_send.disabled = False
         self.update_status("✅ Hazır")
     
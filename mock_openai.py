@@ -0,0 +1,241 @@
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from rate_limiter import TokenRateLimiter
+
+MODELS = ["gpt-4o", "gpt-4o-mini", "gpt-3.5-turbo"]
+ANSWER_WORDS = (
+    "Kılavuza göre önce cihazı kapatın, ardından menü tuşuna basarak ayarlar bölümüne girin "
+    "ve ilgili seçeneği OK tuşu ile onaylayın."
+).split()
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockOpenAI/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length).decode('utf-8')) if length else {}
+
+    def do_GET(self):
+        if urlparse(self.path).path.rstrip("/") == "/v1/models":
+            self._send_json(200, {
+                'object': "list",
+                'data': [{'id': model, 'object': "model", 'created': 0, 'owned_by': "mock"} for model in MODELS]
+            })
+        else:
+            self._send_json(404, {'error': {'message': "Not found", 'type': "invalid_request_error"}})
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/v1/chat/completions":
+            self._send_json(404, {'error': {'message': "Not found", 'type': "invalid_request_error"}})
+            return
+
+        try:
+            payload = self._read_json()
+        except ValueError:
+            self._send_json(400, {'error': {'message': "Invalid JSON", 'type': "invalid_request_error"}})
+            return
+
+        prompt_tokens = sum(len(str(message.get('content') or "")) for message in payload.get('messages', [])) // 4 + 1
+        answer = self.server.answer_tokens()
+        status = self.server.rejection(prompt_tokens + len(answer))
+        if status == 429:
+            self.server.count('rejected')
+            self._send_json(429, {
+                'error': {
+                    'message': "Rate limit reached for requests",
+                    'type': "requests",
+                    'code': "rate_limit_exceeded"
+                }
+            }, headers={'retry-after': str(self.server.retry_after)})
+            return
+        if status:
+            self.server.count('rejected')
+            self._send_json(status, {'error': {'message': "The server had an error", 'type': "server_error"}})
+            return
+
+        self.server.count('requests')
+        model = payload.get('model', MODELS[0])
+        usage = {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': len(answer),
+            'total_tokens': prompt_tokens + len(answer)
+        }
+        self.server.enter()
+        try:
+            self._respond(payload, model, answer, usage)
+        finally:
+            self.server.leave()
+
+    def _respond(self, payload, model, answer, usage):
+        time.sleep(self.server.latency)
+
+        if payload.get('stream'):
+            include_usage = (payload.get('stream_options') or {}).get('include_usage', False)
+            self._stream(model, answer, usage if include_usage else None)
+            return
+
+        time.sleep(len(answer) * self.server.token_delay)
+        self._send_json(200, {
+            'id': f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            'object': "chat.completion",
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': "assistant", 'content': "".join(answer)},
+                'finish_reason': "stop"
+            }],
+            'usage': usage
+        })
+
+    def _stream(self, model, answer, usage):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        def chunk(delta, finish_reason=None, choices=True):
+            data = {'id': completion_id, 'object': "chat.completion.chunk", 'created': created, 'model': model}
+            data['choices'] = [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}] if choices else []
+            return data
+
+        try:
+            self._send_event(chunk({'role': "assistant", 'content': ""}))
+            for token in answer:
+                time.sleep(self.server.token_delay)
+                self._send_event(chunk({'content': token}))
+            self._send_event(chunk({}, "stop"))
+            if usage is not None:
+                final = chunk({}, choices=False)
+                final['usage'] = usage
+                self._send_event(final)
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _send_event(self, data):
+        self._write_chunk(f"data: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8'))
+
+    def _write_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, tokens_per_sec=0, answer_tokens=40,
+                 error_rate=0.0, tpm=0, retry_after=1, error_status=429, seed=0, verbose=False):
+        super().__init__(address, MockOpenAIHandler)
+        self.latency = latency_ms / 1000
+        self.token_delay = 1 / tokens_per_sec if tokens_per_sec else 0.0
+        self.answer_length = answer_tokens
+        self.error_rate = error_rate
+        self.limiter = TokenRateLimiter(tpm) if tpm else None
+        self.retry_after = retry_after
+        self.error_status = error_status
+        self.verbose = verbose
+        self.random = random.Random(seed)
+        self.stats = {'requests': 0, 'rejected': 0, 'in_flight': 0, 'max_in_flight': 0}
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def answer_tokens(self):
+        return [ANSWER_WORDS[i % len(ANSWER_WORDS)] + " " for i in range(self.answer_length)]
+
+    def count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def enter(self):
+        with self._lock:
+            self.stats['in_flight'] += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.stats['in_flight'])
+
+    def leave(self):
+        with self._lock:
+            self.stats['in_flight'] -= 1
+
+    def rejection(self, tokens):
+        with self._lock:
+            if self.error_rate and self.random.random() < self.error_rate:
+                return self.error_status
+        if self.limiter is not None and not self.limiter.try_acquire(tokens):
+            return 429
+        return None
+
+
+def create_mock_server(host="127.0.0.1", port=8001, **options):
+    return MockOpenAIServer((host, port), **options)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çevrimdışı testler için OpenAI uyumlu sahte sunucu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=200, help="İlk token öncesi bekleme")
+    parser.add_argument("--tokens-per-sec", type=float, default=50, help="Token üretim hızı (0: beklemesiz)")
+    parser.add_argument("--answer-tokens", type=int, default=40)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Rastgele hata döndürme olasılığı")
+    parser.add_argument("--error-status", type=int, default=429, help="--error-rate ile dönen HTTP durumu (ör. 502)")
+    parser.add_argument("--tpm", type=int, default=0, help="Dakikalık token limiti; aşılınca 429 (0: sınırsız)")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    server = create_mock_server(
+        args.host, args.port,
+        latency_ms=args.latency_ms,
+        tokens_per_sec=args.tokens_per_sec,
+        answer_tokens=args.answer_tokens,
+        error_rate=args.error_rate,
+        tpm=args.tpm,
+        retry_after=args.retry_after,
+        error_status=args.error_status,
+        seed=args.seed,
+        verbose=args.verbose
+    )
+    print(f"Dinleniyor: {server.base_url}  (OPENAI_BASE_URL={server.base_url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+from array import array
+
+PAGE_HEADER = "\n\n--- SAYFA {} ---\n\n"
+
+
+class PageStore:
+    def __init__(self):
+        self._text = ""
+        self._pending = []
+        self._length = 0
+        self.total_tokens = 0
+        self.page_nums = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.tokens = array('i')
+        self.chunk_pages = array('i')
+        self.chunk_starts = array('q')
+        self.chunk_ends = array('q')
+        self.chunk_tokens = array('i')
+
+    def __len__(self):
+        return len(self.page_nums)
+
+    @property
+    def chunk_count(self):
+        return len(self.chunk_pages)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_text'] = self.text
+        state['_pending'] = []
+        return state
+
+    @property
+    def char_length(self):
+        return self._length
+
+    @property
+    def text(self):
+        if self._pending:
+            self._text = "".join([self._text, *self._pending])
+            self._pending = []
+        return self._text
+
+    def append(self, page_num, page_text, tokens):
+        header = PAGE_HEADER.format(page_num)
+        start = self._length + len(header)
+        self._pending.append(header)
+        self._pending.append(page_text)
+        self._length = start + len(page_text)
+
+        self.page_nums.append(page_num)
+        self.starts.append(start)
+        self.ends.append(self._length)
+        self.tokens.append(tokens)
+        self.total_tokens += tokens
+        return len(self.page_nums) - 1
+
+    def page_text(self, idx):
+        return self.text[self.starts[idx]:self.ends[idx]]
+
+    def section(self, idx):
+        section_start = self.ends[idx - 1] if idx > 0 else 0
+        return self.text[section_start:self.ends[idx]]
+
+    def add_chunk(self, page_idx, start, end, tokens):
+        page_start = self.starts[page_idx]
+        self.chunk_pages.append(page_idx)
+        self.chunk_starts.append(page_start + start)
+        self.chunk_ends.append(page_start + end)
+        self.chunk_tokens.append(tokens)
+        return len(self.chunk_pages) - 1
+
+    def chunk_text(self, idx):
+        return self.text[self.chunk_starts[idx]:self.chunk_ends[idx]]
+
+    def render_chunks(self, chunk_ids):
+        text = self.text
+        spans_by_page = {}
+        for idx in sorted(chunk_ids, key=lambda i: self.chunk_starts[i]):
+            spans = spans_by_page.setdefault(self.chunk_pages[idx], [])
+            start, end = self.chunk_starts[idx], self.chunk_ends[idx]
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+
+        parts = []
+        for page_idx, spans in spans_by_page.items():
+            parts.append(PAGE_HEADER.format(self.page_nums[page_idx]))
+            parts.append(" ... ".join(text[start:end] for start, end in spans))
+        return "".join(parts)
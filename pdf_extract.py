@@ -0,0 +1,58 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import PyPDF2
+
+# A warm pool pays off once each worker gets ~20 pages (~2.5 ms/page in-process).
+PAGES_PER_EXTRACT_WORKER = 20
+# Spawned workers import this module and the entry script before their first page
+# (~0.12 s each via app.py, see benchmarks/run.py), so a cold pool needs more pages.
+PAGES_PER_COLD_EXTRACT_WORKER = 100
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def extract_page_range(pdf_path, start, end):
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [(i, pdf_reader.pages[i].extract_text()) for i in range(start, end)]
+
+
+def start_method():
+    return multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+
+
+def worker_count(total_pages, max_workers):
+    per_worker = PAGES_PER_EXTRACT_WORKER if start_method() == "fork" else PAGES_PER_COLD_EXTRACT_WORKER
+    workers = min(max_workers, total_pages // per_worker)
+    if _pool is not None:
+        workers = max(workers, min(_pool_workers, max_workers, total_pages // PAGES_PER_EXTRACT_WORKER))
+    return workers
+
+
+def extract_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool(pool=None):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or (pool is not None and pool is not _pool):
+            return
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+atexit.register(shutdown_pool)
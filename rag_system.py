@@ -1,101 +1,422 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
 import PyPDF2
+import config
+import pdf_extract
+from answer_cache import AnswerCache
+from corpus import Corpus, Document, DOCUMENT_HEADER, PAGE_HEADER_TOKENS, is_complete_snapshot
+from document_cache import DocumentCache, file_hash
+from llm_client import ChatClientPool
+from rate_limiter import TokenRateLimiter, backoff_delay, is_rate_limit_error, is_transient_error, retry_after_seconds
+from text_analyzer import analyze
+from token_counter import count_tokens
+from tracing import tracer
+
+RAG_MODEL = "gpt-4o"
+GENERAL_MODEL = "gpt-3.5-turbo"
+SUMMARY_MODEL = "gpt-4o-mini"
+EXTRACTOR_VERSION = 6
 
 class RAGSystem:
     def __init__(self):
-        self.full_text = ""
-        self.page_texts = []
-        self.total_tokens = 0
+        self._lock = threading.Condition(threading.RLock())
+        self.document_cache = DocumentCache(config.DOCUMENT_CACHE_DIR, config.DOCUMENT_CACHE_MAX_MB * 1024 * 1024)
+        self.corpus = Corpus(self._load_document, config.MAX_RESIDENT_DOCUMENTS, self._lock)
+        self.chat_clients = ChatClientPool(config.OPENAI_BASE_URL, timeout=config.OPENAI_TIMEOUT)
+        self.max_concurrency = config.ASYNC_MAX_CONCURRENCY
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.rate_limiters = {}
+        self.answer_cache = AnswerCache(
+            config.ANSWER_CACHE_SIZE, config.ANSWER_CACHE_TTL_SECONDS, config.ANSWER_CACHE_SIMILARITY
+        )
+    
+    @property
+    def full_text(self):
+        self.corpus.prefetch()
+        with self._lock:
+            return self._render_full_text(self.corpus.select())
+    
+    @property
+    def total_tokens(self):
+        self.corpus.prefetch()
+        with self._lock:
+            return sum(document.total_tokens for document in self.corpus.select())
+    
+    @property
+    def is_loading(self):
+        return any(document.is_loading for document in list(self.corpus.documents.values()))
         
     def count_tokens(self, text):
-        return int(len(text) * 0.25)
+        return count_tokens(text, RAG_MODEL)
+    
+    def warm_up(self, api_key):
+        if api_key:
+            self.chat_clients.warm_up(api_key, [(RAG_MODEL, 0.2), (GENERAL_MODEL, 0.5), (SUMMARY_MODEL, 0.3)])
+    
+    def _rate_limiter(self, model):
+        with self._lock:
+            limiter = self.rate_limiters.get(model)
+            if limiter is None:
+                limiter = TokenRateLimiter(config.RATE_LIMIT_TPM)
+                self.rate_limiters[model] = limiter
+            return limiter
+    
+    def _context_budget(self):
+        affordable = self._rate_limiter(RAG_MODEL).affordable_tokens(config.RATE_LIMIT_MAX_WAIT)
+        return max(config.RATE_LIMIT_MIN_CONTEXT_TOKENS, min(config.MAX_CONTEXT_TOKENS, affordable))
+    
+    def _request_tokens(self, messages):
+        return sum(self.count_tokens(message.content) for message in messages) + config.RATE_LIMIT_ANSWER_TOKENS
+    
+    def _settle(self, limiter, estimated, message):
+        usage = getattr(message, 'usage_metadata', None)
+        if usage and usage.get('total_tokens'):
+            limiter.adjust(usage['total_tokens'] - estimated)
+    
+    def _retry_delay(self, limiter, estimated, error, attempt):
+        rate_limited = is_rate_limit_error(error)
+        if not rate_limited and not is_transient_error(error):
+            return None
+        limiter.adjust(-estimated)
+        if attempt >= (config.RATE_LIMIT_RETRIES if rate_limited else config.TRANSIENT_RETRIES):
+            return None
+        delay = retry_after_seconds(error) or backoff_delay(attempt)
+        if rate_limited:
+            limiter.pause(delay)
+        return delay
+    
+    def _invoke(self, api_key, model, temperature, messages):
+        limiter = self._rate_limiter(model)
+        estimated = self._request_tokens(messages)
+        chat = self.chat_clients.get(api_key, model, temperature)
+        attempt = 0
+        while True:
+            with tracer.span("rate_limit_wait"):
+                limiter.acquire(estimated)
+            try:
+                with tracer.span(f"llm.{model}", attempt=attempt):
+                    response = chat.invoke(messages)
+            except Exception as e:
+                delay = self._retry_delay(limiter, estimated, e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+                continue
+            self._settle(limiter, estimated, response)
+            return response.content
+    
+    def _stream(self, api_key, model, temperature, messages):
+        limiter = self._rate_limiter(model)
+        estimated = self._request_tokens(messages)
+        chat = self.chat_clients.get(api_key, model, temperature)
+        attempt = 0
+        while True:
+            with tracer.span("rate_limit_wait"):
+                limiter.acquire(estimated)
+            started = False
+            usage = None
+            first_token = tracer.span(f"llm.{model}.first_token", attempt=attempt)
+            try:
+                with tracer.span(f"llm.{model}", attempt=attempt):
+                    for chunk in chat.stream(messages):
+                        if getattr(chunk, 'usage_metadata', None):
+                            usage = chunk
+                        if chunk.content:
+                            if not started:
+                                first_token.end()
+                                started = True
+                            yield chunk.content
+                self._settle(limiter, estimated, usage)
+                return
+            except Exception as e:
+                delay = None if started else self._retry_delay(limiter, estimated, e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+    
+    async def _ainvoke(self, api_key, model, temperature, messages):
+        limiter = self._rate_limiter(model)
+        estimated = self._request_tokens(messages)
+        chat = self.chat_clients.get_async(api_key, model, temperature)
+        attempt = 0
+        while True:
+            with tracer.span("rate_limit_wait"):
+                await limiter.aacquire(estimated)
+            try:
+                async with self._async_semaphore():
+                    with tracer.span(f"llm.{model}", attempt=attempt):
+                        response = await chat.ainvoke(messages)
+            except Exception as e:
+                delay = self._retry_delay(limiter, estimated, e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            self._settle(limiter, estimated, response)
+            return response.content
+    
+    async def _astream(self, api_key, model, temperature, messages):
+        limiter = self._rate_limiter(model)
+        estimated = self._request_tokens(messages)
+        chat = self.chat_clients.get_async(api_key, model, temperature)
+        attempt = 0
+        while True:
+            with tracer.span("rate_limit_wait"):
+                await limiter.aacquire(estimated)
+            started = False
+            usage = None
+            first_token = tracer.span(f"llm.{model}.first_token", attempt=attempt)
+            try:
+                async with self._async_semaphore():
+                    with tracer.span(f"llm.{model}", attempt=attempt):
+                        async for chunk in chat.astream(messages):
+                            if getattr(chunk, 'usage_metadata', None):
+                                usage = chunk
+                            if chunk.content:
+                                if not started:
+                                    first_token.end()
+                                    started = True
+                                yield chunk.content
+                self._settle(limiter, estimated, usage)
+                return
+            except Exception as e:
+                delay = None if started else self._retry_delay(limiter, estimated, e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+    
+    def list_documents(self):
+        with self._lock:
+            return [
+                {'doc_id': document.doc_id, 'name': document.name, 'pages': document.page_count}
+                for document in self.corpus.documents.values()
+            ]
+    
+    def remove_document(self, doc_id):
+        with self._lock:
+            return self.corpus.remove(doc_id) is not None
     
-    def process_pdf(self, pdf_path, progress_callback=None):
-        self.full_text = ""
-        self.page_texts = []
+    def clear_documents(self):
+        with self._lock:
+            self.corpus.clear()
+    
+    def _cache_version(self):
+        return f"{EXTRACTOR_VERSION}-c{config.CHUNK_TOKENS}-o{config.CHUNK_OVERLAP_TOKENS}-e{config.EMBEDDING_DIM}"
+    
+    def process_pdf(self, pdf_path, progress_callback=None, pages_callback=None):
+        document = None
         
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
-                
-                for i, page in enumerate(pdf_reader.pages):
-                    page_text = page.extract_text()
-                    
+            content_hash = file_hash(pdf_path)
+            with self._lock:
+                existing = self.corpus.get(content_hash)
+            if existing:
+                if progress_callback:
+                    progress_callback(100)
+                return existing.page_count
+            
+            cache_key = self.document_cache.make_key(content_hash, self._cache_version())
+            document = Document(content_hash, os.path.basename(pdf_path), pdf_path, cache_key, self.count_tokens)
+            
+            cached = self.document_cache.load(cache_key, is_complete_snapshot)
+            if cached:
+                document.restore(cached)
+                with self._lock:
+                    self.corpus.add(document)
+                if progress_callback:
+                    progress_callback(100)
+                return document.page_count
+            
+            document.is_loading = True
+            with self._lock:
+                self.corpus.add(document)
+            
+            for i, page_text in self._iter_pages(document, progress_callback):
+                with self._lock:
                     if page_text and page_text.strip():
-                        estimated_tokens = int(len(page_text) * 0.25)
-                        
-                        self.page_texts.append({
-                            'page_num': i + 1,
-                            'text': page_text,
-                            'tokens': estimated_tokens
-                        })
-                        self.full_text += f"\n\n--- SAYFA {i + 1} ---\n\n{page_text}"
-                    
-                    if progress_callback and (i % 5 == 0 or i == total_pages - 1):
-                        progress_callback(int((i + 1) / total_pages * 100))
+                        document.add_page(i + 1, page_text)
+                    document.pages_loaded = i + 1
+                
+                if pages_callback and (i % 5 == 0 or i == document.pages_total - 1):
+                    pages_callback(document.pages_loaded, document.pages_total)
+            
+            with self._lock:
+                snapshot = document.snapshot()
+                document.is_loading = False
                         
         except Exception as e:
+            if document is not None:
+                with self._lock:
+                    self.corpus.remove(document.doc_id)
             raise Exception(f"PDF Hatası: {str(e)}")
+        finally:
+            if document is not None:
+                document.is_loading = False
         
-        self.total_tokens = int(len(self.full_text) * 0.25)
-        return len(self.page_texts)
+        self.document_cache.store(document.cache_key, snapshot)
+        return document.page_count
     
-    def _extract_keywords(self, question):
-        words = question.lower().split()
-        stopwords = {'bir', 've', 'için', 'ile', 'mi', 'mı', 'mu', 'mü', 'ne', 'nasıl', 'nedir'}
-        return [w for w in words if len(w) > 2 and w not in stopwords]
+    def _load_document(self, document):
+        document.reset()
+        cached = self.document_cache.load(document.cache_key, is_complete_snapshot)
+        if cached:
+            document.restore(cached)
+            return
+        
+        for i, page_text in self._iter_pages(document):
+            if page_text and page_text.strip():
+                document.add_page(i + 1, page_text)
+            document.pages_loaded = i + 1
+        self.document_cache.store(document.cache_key, document.snapshot())
     
-    def _score_page(self, page_text, keywords):
-        text_lower = page_text.lower()
-        score = sum(text_lower.count(kw) for kw in keywords)
-        return score
+    def _iter_pages(self, document, progress_callback=None):
+        pdf_path = document.path
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            total_pages = len(pdf_reader.pages)
+            document.pages_total = total_pages
+            
+            workers = pdf_extract.worker_count(total_pages, config.PDF_EXTRACT_WORKERS)
+            if workers > 1:
+                yield from self._iter_pages_parallel(pdf_path, total_pages, workers, progress_callback)
+                return
+            
+            for i, page in enumerate(pdf_reader.pages):
+                yield i, page.extract_text()
+                
+                if progress_callback and (i % 5 == 0 or i == total_pages - 1):
+                    progress_callback(int((i + 1) / total_pages * 100))
     
-    def get_context_for_query(self, question, max_tokens=25000):
-        available_tokens = max_tokens - 5000
+    def _iter_pages_parallel(self, pdf_path, total_pages, workers, progress_callback=None):
+        batch_size = max(1, min(pdf_extract.PAGES_PER_EXTRACT_WORKER, total_pages // (workers * 4)))
+        starts = list(range(0, total_pages, batch_size))
+        results = {}
+        next_batch = 0
+        done_pages = 0
         
-        if self.total_tokens <= available_tokens:
-            return self.full_text
-        
-        keywords = self._extract_keywords(question)
-        
-        scored_pages = []
-        for page_data in self.page_texts:
-            score = self._score_page(page_data['text'], keywords)
-            scored_pages.append({
-                'score': score,
-                'page_num': page_data['page_num'],
-                'text': page_data['text'],
-                'tokens': page_data['tokens']
-            })
-        
-        scored_pages.sort(key=lambda x: x['score'], reverse=True)
-        
-        selected_text = ""
+        pool = pdf_extract.extract_pool(workers)
+        futures = {
+            pool.submit(pdf_extract.extract_page_range, pdf_path, start, min(start + batch_size, total_pages)): start
+            for start in starts
+        }
+        try:
+            for future in as_completed(futures):
+                batch = future.result()
+                results[futures[future]] = batch
+                done_pages += len(batch)
+                
+                while next_batch < len(starts) and starts[next_batch] in results:
+                    yield from results.pop(starts[next_batch])
+                    next_batch += 1
+                
+                if progress_callback:
+                    progress_callback(int(done_pages / total_pages * 100))
+        except BrokenProcessPool:
+            pdf_extract.shutdown_pool(pool)
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def _extract_keywords(self, question):
+        return analyze(question)
+    
+    def _render_full_text(self, documents):
+        if len(documents) == 1:
+            return documents[0].pages.text
+        return "".join(DOCUMENT_HEADER.format(document.name) + document.pages.text for document in documents)
+    
+    def _render_selection(self, selection, with_headers):
+        if not with_headers:
+            document, chunk_ids = next(iter(selection.items()))
+            return document.pages.render_chunks(chunk_ids)
+        return "".join(
+            DOCUMENT_HEADER.format(document.name) + document.pages.render_chunks(chunk_ids)
+            for document, chunk_ids in selection.items()
+        )
+    
+    def get_context_for_query(self, question, max_tokens=25000, doc_ids=None):
+        return self._build_context(question, max_tokens, doc_ids)[0]
+    
+    def _build_context(self, question, max_tokens=25000, doc_ids=None):
+        with tracer.span("retrieval", max_tokens=max_tokens):
+            context_text, doc_key, _sources = self.build_contexts([question], max_tokens, doc_ids)[0]
+        return context_text, doc_key
+    
+    def build_contexts(self, questions, max_tokens=25000, doc_ids=None):
+        self.corpus.prefetch(doc_ids)
+        with self._lock:
+            available_tokens = max_tokens - 5000
+            documents = self.corpus.select(doc_ids)
+            doc_key = ",".join(f"{document.doc_id}:{document.page_count}" for document in documents)
+            total_tokens = sum(document.total_tokens for document in documents)
+            
+            if total_tokens <= available_tokens:
+                sources = self._sources([(document, list(document.pages.page_nums)) for document in documents])
+                return [(self._render_full_text(documents), doc_key, sources)] * len(questions)
+            
+            ranked_lists = self.corpus.rank_batch([self._extract_keywords(question) for question in questions], documents)
+            return [
+                (context_text, doc_key, sources)
+                for context_text, sources in (
+                    self._pack_context(ranked, documents, total_tokens, available_tokens) for ranked in ranked_lists
+                )
+            ]
+    
+    def _sources(self, pages_by_document):
+        return [
+            {'doc_id': document.doc_id, 'name': document.name, 'pages': pages}
+            for document, pages in pages_by_document if pages
+        ]
+    
+    def _pack_context(self, ranked, documents, total_tokens, available_tokens):
+        selection = {}
         used_tokens = 0
         
-        for page in scored_pages:
-            if used_tokens + page['tokens'] > available_tokens:
+        for _score, document, chunk_idx in ranked:
+            chunk_tokens = document.pages.chunk_tokens[chunk_idx] + PAGE_HEADER_TOKENS
+            if len(documents) > 1 and document not in selection:
+                chunk_tokens += PAGE_HEADER_TOKENS
+            if used_tokens + chunk_tokens > available_tokens:
+                continue
+            selection.setdefault(document, []).append(chunk_idx)
+            used_tokens += chunk_tokens
+            if available_tokens - used_tokens < PAGE_HEADER_TOKENS:
                 break
-            selected_text += f"\n\n--- SAYFA {page['page_num']} ---\n\n{page['text']}"
-            used_tokens += page['tokens']
         
-        return selected_text if selected_text else self.full_text[:available_tokens * 4]
-    
-    def query(self, question, api_key):
-        if not self.full_text:
-            return "Lütfen önce bir PDF dosyası yükleyin."
+        if selection:
+            sources = self._sources([
+                (document, sorted({document.pages.page_nums[document.pages.chunk_pages[i]] for i in chunk_ids}))
+                for document, chunk_ids in selection.items()
+            ])
+            return self._render_selection(selection, len(documents) > 1), sources
         
-        context_text = self.get_context_for_query(question)
+        full_text = self._render_full_text(documents)
+        chars_per_token = len(full_text) / max(1, total_tokens)
+        cut = int(available_tokens * chars_per_token)
         
-        if not context_text.strip():
-            return "###ASK_FALLBACK###"
-
-        try:
-            chat = ChatOpenAI(openai_api_key=api_key, model_name="gpt-4o", temperature=0.2)
-            
-            system_prompt = f"""Sen bir teknik destek asistanısın ve kullanıcıya yüklenen PDF kullanım kılavuzunu açıklıyorsun.
+        pages_by_document = []
+        offset = 0
+        for document in documents:
+            if len(documents) > 1:
+                offset += len(DOCUMENT_HEADER.format(document.name))
+            store = document.pages
+            pages_by_document.append((document, [store.page_nums[i] for i in range(len(store)) if offset + store.starts[i] < cut]))
+            offset += store.char_length
+        return full_text[:cut], self._sources(pages_by_document)
+    
+    def _build_system_prompt(self, context_text):
+        return f"""Sen bir teknik destek asistanısın ve kullanıcıya yüklenen PDF kullanım kılavuzunu açıklıyorsun.
 
 BAĞLAM (Kullanım Kılavuzundan):
 {context_text}
@@ -114,37 +435,171 @@ CEVAP TARZI:
 - Gereksiz giriş cümleleri kullanma
 - "Daha fazla bilgi için..." cümleleri KULLANMA
 """
-            response = chat.invoke([
-                SystemMessage(content=system_prompt), 
+
+    def query(self, question, api_key, doc_ids=None):
+        if not self.corpus.has_content():
+            return "Lütfen önce bir PDF dosyası yükleyin."
+        
+        context_text, doc_key = self._build_context(question, self._context_budget(), doc_ids)
+        
+        if not context_text.strip():
+            return "###ASK_FALLBACK###"
+
+        cached = self.answer_cache.get(doc_key, question, context_text)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self._invoke(api_key, RAG_MODEL, 0.2, [
+                SystemMessage(content=self._build_system_prompt(context_text)), 
                 HumanMessage(content=question)
-            ]).content
+            ])
             
+            self.answer_cache.put(doc_key, question, context_text, response)
             return response
 
         except Exception as e:
             return f"API Hatası: {str(e)}"
 
+    def query_stream(self, question, api_key, doc_ids=None):
+        if not self.corpus.has_content():
+            yield "Lütfen önce bir PDF dosyası yükleyin."
+            return
+        
+        context_text, doc_key = self._build_context(question, self._context_budget(), doc_ids)
+        
+        if not context_text.strip():
+            yield "###ASK_FALLBACK###"
+            return
+
+        cached = self.answer_cache.get(doc_key, question, context_text)
+        if cached is not None:
+            yield cached
+            return
+
+        try:
+            chunks = []
+            
+            for chunk in self._stream(api_key, RAG_MODEL, 0.2, [
+                SystemMessage(content=self._build_system_prompt(context_text)), 
+                HumanMessage(content=question)
+            ]):
+                chunks.append(chunk)
+                yield chunk
+
+            self.answer_cache.put(doc_key, question, context_text, "".join(chunks))
+
+        except Exception as e:
+            yield f"API Hatası: {str(e)}"
+
     def query_general(self, question, api_key):
         try:
-            chat = ChatOpenAI(openai_api_key=api_key, model_name="gpt-3.5-turbo", temperature=0.5)
             system_prompt = "Sen yardımcı bir asistansın. Kullanıcıya genel konularda yardımcı ol."
             
-            response = chat.invoke([
+            response = self._invoke(api_key, GENERAL_MODEL, 0.5, [
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=question)
-            ]).content
+            ])
             return response
         except Exception as e:
             return f"Hata: {e}"
 
+    def query_general_stream(self, question, api_key):
+        try:
+            system_prompt = "Sen yardımcı bir asistansın. Kullanıcıya genel konularda yardımcı ol."
+            
+            yield from self._stream(api_key, GENERAL_MODEL, 0.5, [
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=question)
+            ])
+        except Exception as e:
+            yield f"Hata: {e}"
+
     def generate_summary(self, text, api_key):
         try:
-            chat = ChatOpenAI(openai_api_key=api_key, model_name="gpt-4o-mini", temperature=0.3)
             system_prompt = "Bu metni sesli okunmak üzere 1-2 cümleyle özetle. Gereksiz detayları at, direkt sonucu söyle."
-            response = chat.invoke([
+            response = self._invoke(api_key, SUMMARY_MODEL, 0.3, [
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=text)
+            ])
+            return response
+        except Exception:
+            return text[:300] + "..."
+
+    def _async_semaphore(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def aquery(self, question, api_key, doc_ids=None):
+        if not self.corpus.has_content():
+            return "Lütfen önce bir PDF dosyası yükleyin."
+        
+        context_text, doc_key = await asyncio.to_thread(self._build_context, question, self._context_budget(), doc_ids)
+        
+        if not context_text.strip():
+            return "###ASK_FALLBACK###"
+
+        return await self.aanswer(question, context_text, doc_key, api_key)
+
+    async def aanswer(self, question, context_text, doc_key, api_key):
+        cached = self.answer_cache.get(doc_key, question, context_text)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._ainvoke(api_key, RAG_MODEL, 0.2, [
+                SystemMessage(content=self._build_system_prompt(context_text)), 
+                HumanMessage(content=question)
+            ])
+            
+            self.answer_cache.put(doc_key, question, context_text, response)
+            return response
+
+        except Exception as e:
+            return f"API Hatası: {str(e)}"
+
+    async def aquery_stream(self, question, api_key, doc_ids=None):
+        if not self.corpus.has_content():
+            yield "Lütfen önce bir PDF dosyası yükleyin."
+            return
+        
+        context_text, doc_key = await asyncio.to_thread(self._build_context, question, self._context_budget(), doc_ids)
+        
+        if not context_text.strip():
+            yield "###ASK_FALLBACK###"
+            return
+
+        cached = self.answer_cache.get(doc_key, question, context_text)
+        if cached is not None:
+            yield cached
+            return
+
+        try:
+            chunks = []
+            
+            async for chunk in self._astream(api_key, RAG_MODEL, 0.2, [
+                SystemMessage(content=self._build_system_prompt(context_text)), 
+                HumanMessage(content=question)
+            ]):
+                chunks.append(chunk)
+                yield chunk
+
+            self.answer_cache.put(doc_key, question, context_text, "".join(chunks))
+
+        except Exception as e:
+            yield f"API Hatası: {str(e)}"
+
+    async def agenerate_summary(self, text, api_key):
+        try:
+            system_prompt = "Bu metni sesli okunmak üzere 1-2 cümleyle özetle. Gereksiz detayları at, direkt sonucu söyle."
+            response = await self._ainvoke(api_key, SUMMARY_MODEL, 0.3, [
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=text)
-            ]).content
+            ])
             return response
         except Exception:
-            return text[:300] + "..."
\ No newline at end of file
+            return text[:300] + "..."
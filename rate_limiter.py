@@ -0,0 +1,94 @@
+import asyncio
+import random
+import threading
+import time
+
+# Retried like the OpenAI SDK does: dropped connections, timeouts and 408/409/5xx
+TRANSIENT_ERRORS = ("APIConnectionError", "APITimeoutError", "TransportError", "ConnectionError", "TimeoutError")
+
+
+def is_rate_limit_error(error):
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status == 429 or type(error).__name__ == "RateLimitError"
+
+
+def is_transient_error(error):
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is not None:
+        return status in (408, 409) or status >= 500
+    return any(cls.__name__ in TRANSIENT_ERRORS for cls in type(error).__mro__)
+
+
+def retry_after_seconds(error):
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenRateLimiter:
+    def __init__(self, tokens_per_minute=30000):
+        self.capacity = tokens_per_minute
+        self.refill_per_second = tokens_per_minute / 60.0
+        self.tokens = float(tokens_per_minute)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def affordable_tokens(self, max_wait):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, max_wait - max(0.0, self.paused_until - now))
+            return int(min(self.capacity, self.tokens + wait * self.refill_per_second))
+
+    def _reserve(self, tokens):
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.refill_per_second
+
+    def try_acquire(self, tokens):
+        return self._reserve(tokens) <= 0
+
+    def acquire(self, tokens):
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens):
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def adjust(self, tokens):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens - tokens)
+
+    def pause(self, seconds):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
@@ -0,0 +1,55 @@
+import math
+
+
+class BM25Index:
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}
+        self.doc_lengths = []
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add_document(self, tokens):
+        doc_id = len(self.doc_lengths)
+        term_freqs = {}
+        for token in tokens:
+            term_freqs[token] = term_freqs.get(token, 0) + 1
+
+        for term, tf in term_freqs.items():
+            self.postings.setdefault(term, []).append((doc_id, tf))
+
+        self.doc_lengths.append(len(tokens))
+        self.total_length += len(tokens)
+        return doc_id
+
+    def document_frequency(self, term):
+        return len(self.postings.get(term, ()))
+
+    def idf(self, term):
+        df = self.document_frequency(term)
+        n = len(self.doc_lengths)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, terms, top_k=None, idf=None, avg_length=None):
+        if not self.doc_lengths:
+            return []
+
+        if avg_length is None:
+            avg_length = self.total_length / len(self.doc_lengths) or 1.0
+        k1, b = self.k1, self.b
+        scores = {}
+
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            term_idf = idf[term] if idf is not None else self.idf(term)
+            for doc_id, tf in postings:
+                norm = k1 * (1 - b + b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + term_idf * tf * (k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:top_k] if top_k else ranked
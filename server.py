@@ -0,0 +1,231 @@
+import argparse
+import hmac
+import ipaddress
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import config
+
+
+class RAGRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "RAGPDFAssistant/1.0"
+
+    @property
+    def rag(self):
+        return self.server.rag
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def _authorized(self):
+        token = self.server.token
+        if not token:
+            return True
+        header = self.headers.get("Authorization") or ""
+        if hmac.compare_digest(header.encode('utf-8'), f"Bearer {token}".encode('utf-8')):
+            return True
+        self._send_json(401, {'error': "Yetkisiz"})
+        return False
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self._send_json(200, {'status': "ok", 'loading': self.rag.is_loading})
+        elif not self._authorized():
+            return
+        elif path == "/documents":
+            self._send_json(200, {'documents': self.rag.list_documents()})
+        else:
+            self._send_json(404, {'error': "Bulunamadı"})
+
+    def do_DELETE(self):
+        if not self._authorized():
+            return
+        path = urlparse(self.path).path
+        if path.startswith("/documents/"):
+            removed = self.rag.remove_document(path[len("/documents/"):])
+            self._send_json(200 if removed else 404, {'removed': removed})
+        else:
+            self._send_json(404, {'error': "Bulunamadı"})
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        path = urlparse(self.path).path
+        try:
+            payload = self._read_json()
+        except ValueError:
+            self._send_json(400, {'error': "Geçersiz JSON"})
+            return
+        if not isinstance(payload, dict):
+            self._send_json(400, {'error': "JSON nesnesi bekleniyor"})
+            return
+
+        if path == "/documents":
+            self._load_document(payload)
+        elif path == "/query":
+            self._query(payload)
+        elif path == "/query/stream":
+            self._query_stream(payload)
+        else:
+            self._send_json(404, {'error': "Bulunamadı"})
+
+    def _load_document(self, payload):
+        pdf_path = payload.get('path')
+        if not isinstance(pdf_path, str) or not pdf_path:
+            self._send_json(400, {'error': "'path' alanı gerekli"})
+            return
+        pdf_path = resolve_document(self.server.document_root, pdf_path)
+        if pdf_path is None:
+            self._send_json(404, {'error': "Belge bulunamadı"})
+            return
+        try:
+            count = self.rag.process_pdf(pdf_path)
+        except Exception as e:
+            self.log_error("PDF yüklenemedi: %s: %s", pdf_path, e)
+            self._send_json(422, {'error': "PDF işlenemedi"})
+            return
+        self._send_json(200, {'pages': count, 'documents': self.rag.list_documents()})
+
+    def _query_args(self, payload):
+        question = payload.get('question')
+        if not isinstance(question, str) or not question.strip():
+            self._send_json(400, {'error': "'question' alanı gerekli"})
+            return None
+        doc_ids = payload.get('doc_ids')
+        if doc_ids is not None and not (isinstance(doc_ids, list) and all(isinstance(doc_id, str) for doc_id in doc_ids)):
+            self._send_json(400, {'error': "'doc_ids' metin listesi olmalı"})
+            return None
+        return question.strip(), doc_ids
+
+    def _query(self, payload):
+        args = self._query_args(payload)
+        if args is None:
+            return
+        question, doc_ids = args
+
+        answer = self.rag.query(question, self.server.api_key, doc_ids=doc_ids)
+        if answer == "###ASK_FALLBACK###":
+            self._send_json(200, {'answer': None, 'fallback': True})
+        else:
+            self._send_json(200, {'answer': answer, 'fallback': False})
+
+    def _query_stream(self, payload):
+        args = self._query_args(payload)
+        if args is None:
+            return
+        question, doc_ids = args
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            for chunk in self.rag.query_stream(question, self.server.api_key, doc_ids=doc_ids):
+                if chunk == "###ASK_FALLBACK###":
+                    self._send_event("fallback", {})
+                    break
+                self._send_event("token", {'text': chunk})
+            self._send_event("done", {})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_event(self, event, data):
+        message = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+        self.wfile.write(message.encode('utf-8'))
+        self.wfile.flush()
+
+
+def resolve_document(root, pdf_path):
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, pdf_path))
+    try:
+        inside = os.path.commonpath([root, path]) == root
+    except ValueError:
+        inside = False
+    return path if inside and os.path.isfile(path) else None
+
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def create_server(rag_system, host="127.0.0.1", port=8000, api_key=None, verbose=False,
+                  document_root=None, token=None):
+    token = token if token is not None else config.SERVER_TOKEN
+    if not token and not is_loopback(host):
+        raise ValueError("Yerel olmayan adreste dinlemek için erişim anahtarı gerekli (--token / RAG_SERVER_TOKEN)")
+    server = ThreadingHTTPServer((host, port), RAGRequestHandler)
+    server.daemon_threads = True
+    server.rag = rag_system
+    server.api_key = api_key if api_key is not None else config.API_KEY
+    server.document_root = document_root or config.SERVER_DOCUMENT_ROOT
+    server.token = token
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="R.A.G PDF Asistanı HTTP servisi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pdf", action="append", default=[], help="Başlangıçta yüklenecek PDF (tekrarlanabilir)")
+    parser.add_argument("--document-root", default=config.SERVER_DOCUMENT_ROOT,
+                        help="POST /documents ile yalnızca bu klasörün altındaki dosyalar yüklenebilir")
+    parser.add_argument("--token", default=config.SERVER_TOKEN,
+                        help="İsteklerde 'Authorization: Bearer <anahtar>' zorunlu olur (yerel olmayan adreste gerekli)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not args.token and not is_loopback(args.host):
+        print("Hata: yerel olmayan adreste dinlemek için --token veya RAG_SERVER_TOKEN gerekli", file=sys.stderr)
+        sys.exit(2)
+
+    from rag_system import RAGSystem
+
+    rag_system = RAGSystem()
+    rag_system.warm_up(config.API_KEY)
+    for pdf_path in args.pdf:
+        count = rag_system.process_pdf(pdf_path)
+        print(f"{pdf_path}: {count} sayfa yüklendi")
+
+    server = create_server(rag_system, args.host, args.port, verbose=args.verbose,
+                           document_root=args.document_root, token=args.token)
+    print(f"Dinleniyor: http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
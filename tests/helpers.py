@@ -0,0 +1,15 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import Document
+
+def approximate_tokens(text):
+    return len(text) // 4
+
+def make_document(doc_id, pages, token_counter=approximate_tokens):
+    document = Document(doc_id, f"{doc_id}.pdf", f"/tmp/{doc_id}.pdf", f"{doc_id}-v1", token_counter)
+    for page_num, text in enumerate(pages, 1):
+        document.add_page(page_num, text)
+    return document
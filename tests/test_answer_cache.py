@@ -0,0 +1,39 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from answer_cache import AnswerCache
+
+class TestAnswerCache(unittest.TestCase):
+    def test_hit_ignores_case_and_punctuation(self):
+        cache = AnswerCache()
+        cache.put("doc", "Güç tuşu nerede?", "bağlam", "Sağ üstte.")
+        self.assertEqual(cache.get("doc", "güç tuşu nerede", "bağlam"), "Sağ üstte.")
+
+    def test_miss_on_other_document(self):
+        cache = AnswerCache(similarity_threshold=0)
+        cache.put("doc", "Güç tuşu nerede?", "bağlam", "Sağ üstte.")
+        self.assertIsNone(cache.get("diger", "Güç tuşu nerede?", "bağlam"))
+
+    def test_near_duplicate_keywords(self):
+        cache = AnswerCache(similarity_threshold=1.0)
+        cache.put("doc", "Güç tuşu nerede?", "bağlam", "Sağ üstte.")
+        self.assertEqual(cache.get("doc", "Acaba güç tuşu nerede", "başka bağlam"), "Sağ üstte.")
+
+    def test_ttl_expiry(self):
+        cache = AnswerCache(ttl_seconds=1)
+        cache.put("doc", "soru", "bağlam", "cevap")
+        next(iter(cache._entries.values()))['created'] -= 5
+        self.assertIsNone(cache.get("doc", "soru", "bağlam"))
+
+    def test_lru_limit(self):
+        cache = AnswerCache(max_entries=1, similarity_threshold=0)
+        cache.put("doc", "birinci soru", "bağlam", "1")
+        cache.put("doc", "ikinci soru", "bağlam", "2")
+        self.assertIsNone(cache.get("doc", "birinci soru", "bağlam"))
+        self.assertEqual(len(cache), 1)
+
+if __name__ == '__main__':
+    unittest.main()
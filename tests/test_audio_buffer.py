@@ -0,0 +1,118 @@
+import unittest
+import io
+import os
+import struct
+import sys
+import tempfile
+import wave
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio_buffer import PcmBuffer, PcmStream, WAVE_FORMAT_IEEE_FLOAT, parse_wav, read_wav
+
+def wav_bytes(samples, channels=1, rate=16000):
+    out = io.BytesIO()
+    with wave.open(out, 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(np.asarray(samples, dtype='<i2').tobytes())
+    return out.getvalue()
+
+def chunk(chunk_id, body):
+    return chunk_id + struct.pack('<I', len(body)) + body + (b"\0" if len(body) % 2 else b"")
+
+class TestParseWav(unittest.TestCase):
+    def test_pcm16_mono(self):
+        pcm = parse_wav(wav_bytes([0, 16384, -32768, 32767]))
+        self.assertEqual((pcm.sample_rate, pcm.channels, pcm.bits), (16000, 1, 16))
+        self.assertEqual(pcm.frames, 4)
+        np.testing.assert_allclose(pcm.normalized(pcm.samples()), [0.0, 0.5, -1.0, 32767 / 32768])
+
+    def test_stereo_samples_are_first_channel(self):
+        pcm = parse_wav(wav_bytes([1, -1, 2, -2, 3, -3], channels=2))
+        self.assertEqual(pcm.frames, 3)
+        self.assertEqual(pcm.samples().tolist(), [1, 2, 3])
+
+    def test_samples_share_the_source_buffer(self):
+        data = bytearray(wav_bytes([5, 6, 7]))
+        pcm = parse_wav(data)
+        samples = pcm.samples()
+        data[-2:] = struct.pack('<h', 99)
+        self.assertEqual(samples[-1], 99)
+
+    def test_skips_unknown_chunks_and_reads_extensible_float(self):
+        fmt = struct.pack('<HHIIHH', 0xFFFE, 1, 8000, 32000, 4, 32)
+        fmt += struct.pack('<HHI', 22, 32, 0) + struct.pack('<H', WAVE_FORMAT_IEEE_FLOAT) + b"\0" * 14
+        data = np.array([0.25, -0.5], dtype='<f4').tobytes()
+        body = b"WAVE" + chunk(b"fmt ", fmt) + chunk(b"LIST", b"odd") + chunk(b"data", data)
+        pcm = parse_wav(b"RIFF" + struct.pack('<I', len(body)) + body)
+        self.assertEqual(pcm.format_tag, WAVE_FORMAT_IEEE_FLOAT)
+        np.testing.assert_allclose(pcm.normalized(pcm.samples()), [0.25, -0.5])
+
+    def test_truncated_trailing_frame_is_dropped(self):
+        pcm = PcmBuffer(b"\x01\x00\x02\x00\x03", 8000)
+        self.assertEqual(pcm.frames, 2)
+        self.assertEqual(pcm.duration_ms, 0.25)
+
+    def test_invalid_data_raises(self):
+        with self.assertRaises(ValueError):
+            parse_wav(b"RIFF\0\0\0\0AIFF")
+        with self.assertRaises(ValueError):
+            parse_wav(b"RIFF\4\0\0\0WAVE")
+        with self.assertRaises(ValueError):
+            PcmBuffer(b"", 8000, bits=24)
+
+    def test_read_wav(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ses.wav")
+            with open(path, 'wb') as f:
+                f.write(wav_bytes([1, 2, 3, 4]))
+            self.assertEqual(read_wav(path).samples().tolist(), [1, 2, 3, 4])
+
+def pcm16(samples, rate=8000):
+    return PcmBuffer(np.asarray(samples, dtype='<i2').tobytes(), rate)
+
+class TestPcmStream(unittest.TestCase):
+    def test_segments_read_back_to_back(self):
+        stream = PcmStream()
+        stream.append(pcm16([1, 2, 3]))
+        stream.append(pcm16([4, 5]))
+        self.assertEqual(np.frombuffer(stream.read(8), '<i2').tolist(), [1, 2, 3, 4])
+        stream.append(pcm16([6]))
+        self.assertEqual(stream.remaining, 4)
+        self.assertEqual(np.frombuffer(stream.read(100), '<i2').tolist(), [5, 6])
+        self.assertEqual(stream.read(100), b"")
+        self.assertEqual(stream.remaining, 0)
+
+    def test_rejects_other_formats(self):
+        stream = PcmStream()
+        stream.append(pcm16([1]))
+        self.assertTrue(stream.accepts(pcm16([2])))
+        self.assertFalse(stream.accepts(pcm16([2], rate=16000)))
+        with self.assertRaises(ValueError):
+            stream.append(pcm16([2], rate=16000))
+
+    def test_window_follows_position_across_segments(self):
+        stream = PcmStream()
+        stream.append(pcm16([0, 16384]))
+        stream.append(pcm16([-16384, 8192, 0]))
+        np.testing.assert_allclose(stream.window(2, 4), [0.5])
+        np.testing.assert_allclose(stream.window(4, 2), [-0.5, 0.25])
+        self.assertIsNone(stream.window(10, 2))
+
+    def test_release_drops_played_segments(self):
+        stream = PcmStream()
+        stream.append(pcm16([1, 2]))
+        stream.append(pcm16([3, 4]))
+        stream.read(8)
+        stream.release(3)
+        self.assertEqual(len(stream.segments), 2)
+        stream.release(4)
+        self.assertEqual(len(stream.segments), 1)
+        np.testing.assert_allclose(stream.window(6, 1), [4 / 32768])
+
+if __name__ == '__main__':
+    unittest.main()
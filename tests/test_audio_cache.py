@@ -0,0 +1,54 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio_cache import AudioCache
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = AudioCache(os.path.join(self.tmp.name, "audio"), max_bytes=250)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_wav(self, size=100):
+        fd, path = tempfile.mkstemp(dir=self.tmp.name, suffix=".wav")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b"\0" * size)
+        return path
+
+    def test_voice_is_persisted(self):
+        self.assertIsNone(self.cache.load_voice())
+        self.cache.save_voice("TTS_MS_TR-TR_TOLGA_11.0")
+        self.assertEqual(AudioCache(self.cache.cache_dir).load_voice(), "TTS_MS_TR-TR_TOLGA_11.0")
+
+    def test_key_uses_normalized_text_voice_and_rate(self):
+        key = self.cache.key_for("Sıcaklık 5°", "tolga", 150)
+        self.assertEqual(key, self.cache.key_for("Sıcaklık   5 derece ", "tolga", 150))
+        self.assertNotEqual(key, self.cache.key_for("Sıcaklık 5°", "tolga", 180))
+        self.assertNotEqual(key, self.cache.key_for("Sıcaklık 5°", "", 150))
+
+    def test_put_then_get(self):
+        key = self.cache.key_for("Merhaba", "", 150)
+        self.assertIsNone(self.cache.get(key))
+        path = self.cache.put(key, self.make_wav())
+        self.assertEqual(self.cache.get(key), path)
+
+    def test_least_recently_used_is_evicted(self):
+        keys = [self.cache.key_for(text, "", 150) for text in ("bir", "iki", "üç")]
+        first = self.cache.put(keys[0], self.make_wav())
+        second = self.cache.put(keys[1], self.make_wav())
+        past = time.time() - 60
+        os.utime(second, (past, past))
+        os.utime(first, (past + 1, past + 1))
+        self.cache.put(keys[2], self.make_wav())
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import read_questions, run_batch
+
+class StubChatClients:
+    async def aclose(self):
+        pass
+
+class StubRAG:
+    chat_clients = StubChatClients()
+
+    def build_contexts(self, questions, max_tokens=25000, doc_ids=None):
+        sources = [{'doc_id': "abc", 'name': "kilavuz.pdf", 'pages': [2, 5]}]
+        return [("" if question == "yok" else "bağlam", "abc:5", sources) for question in questions]
+
+    async def aanswer(self, question, context_text, doc_key, api_key):
+        return f"Cevap: {question}"
+
+class TestBatch(unittest.TestCase):
+    def test_read_questions_skips_blank_and_comments(self):
+        with tempfile.NamedTemporaryFile('w', suffix=".txt", delete=False, encoding='utf-8') as f:
+            f.write("# başlık\nGüç tuşu nerede?\n\n  Pil nasıl değişir?  \n")
+        try:
+            self.assertEqual(read_questions(f.name), ["Güç tuşu nerede?", "Pil nasıl değişir?"])
+        finally:
+            os.remove(f.name)
+
+    def test_records_keep_order_and_provenance(self):
+        records, _ = run_batch(StubRAG(), ["bir", "yok", "iki"], "sk-test")
+        self.assertEqual([record['index'] for record in records], [0, 1, 2])
+        self.assertEqual(records[0]['answer'], "Cevap: bir")
+        self.assertEqual(records[0]['sources'][0]['pages'], [2, 5])
+        self.assertTrue(records[1]['fallback'])
+        self.assertIsNone(records[1]['answer'])
+        self.assertIn('retrieval_ms', records[2])
+
+if __name__ == '__main__':
+    unittest.main()
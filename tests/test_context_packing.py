@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import PAGE_HEADER_TOKENS
+from helpers import make_document
+from rag_system import RAGSystem
+
+def page(word, words):
+    return " ".join([word] * words)
+
+class TestPackContext(unittest.TestCase):
+    def setUp(self):
+        self.rag_system = RAGSystem()
+        self.tv = make_document("tv", [page("kumanda", 40), page("kanal", 10), page("ses", 20)])
+        self.firin = make_document("firin", [page("kapak", 15), page("izgara", 30)])
+
+    def cost(self, document, chunk_idx):
+        return document.pages.chunk_tokens[chunk_idx] + PAGE_HEADER_TOKENS
+
+    def pack(self, ranked, documents, available_tokens):
+        total_tokens = sum(document.total_tokens for document in documents)
+        return self.rag_system._pack_context(ranked, documents, total_tokens, available_tokens)
+
+    def test_chunks_that_do_not_fit_are_skipped_not_fatal(self):
+        ranked = [(0.9, self.tv, 0), (0.8, self.tv, 1), (0.7, self.tv, 2)]
+        available = self.cost(self.tv, 1) + self.cost(self.tv, 2)
+        self.assertLess(available, self.cost(self.tv, 0) + self.cost(self.tv, 1))
+
+        context, sources = self.pack(ranked, [self.tv], available)
+        self.assertEqual(context, self.tv.pages.render_chunks([1, 2]))
+        self.assertEqual(sources, [{'doc_id': "tv", 'name': "tv.pdf", 'pages': [2, 3]}])
+
+    def test_page_header_is_charged(self):
+        ranked = [(0.9, self.tv, 1), (0.8, self.tv, 2)]
+        context, sources = self.pack(ranked, [self.tv], self.cost(self.tv, 1) + self.cost(self.tv, 2) - 1)
+        self.assertEqual(sources[0]['pages'], [2])
+        self.assertNotIn("ses", context)
+
+    def test_document_header_is_charged_once_per_document(self):
+        documents = [self.tv, self.firin]
+        ranked = [(0.9, self.tv, 1), (0.8, self.firin, 0), (0.7, self.tv, 2)]
+        exact = self.cost(self.tv, 1) + self.cost(self.firin, 0) + self.cost(self.tv, 2) + 2 * PAGE_HEADER_TOKENS
+
+        context, sources = self.pack(ranked, documents, exact)
+        self.assertEqual([(source['doc_id'], source['pages']) for source in sources], [("tv", [2, 3]), ("firin", [1])])
+        self.assertEqual(context.count("=== BELGE:"), 2)
+
+        _, sources = self.pack(ranked, documents, exact - 1)
+        self.assertEqual([(source['doc_id'], source['pages']) for source in sources], [("tv", [2]), ("firin", [1])])
+
+    def test_selection_never_exceeds_budget(self):
+        documents = [self.tv, self.firin]
+        ranked = [(0.9, self.firin, 1), (0.8, self.tv, 0), (0.7, self.tv, 2), (0.6, self.firin, 0), (0.5, self.tv, 1)]
+        largest = max(self.cost(document, chunk_idx) for _, document, chunk_idx in ranked) + PAGE_HEADER_TOKENS
+        for available in range(largest, sum(document.total_tokens for document in documents) + 50, 7):
+            _, sources = self.pack(ranked, documents, available)
+            by_id = {document.doc_id: document for document in documents}
+            used = sum(
+                PAGE_HEADER_TOKENS + sum(self.cost(by_id[source['doc_id']], page_num - 1) for page_num in source['pages'])
+                for source in sources
+            )
+            self.assertLessEqual(used, available)
+            self.assertTrue(sources)
+
+    def test_fallback_cuts_full_text_when_nothing_fits(self):
+        smallest = min(self.cost(self.tv, i) for i in range(3))
+        available = smallest - 1
+        context, sources = self.pack([(0.9, self.tv, 0)], [self.tv], available)
+
+        full_text = self.tv.pages.text
+        cut = int(available * len(full_text) / self.tv.total_tokens)
+        self.assertEqual(context, full_text[:cut])
+        self.assertEqual(sources, [{'doc_id': "tv", 'name': "tv.pdf", 'pages': [1]}])
+
+if __name__ == '__main__':
+    unittest.main()
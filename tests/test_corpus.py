@@ -0,0 +1,128 @@
+import unittest
+import io
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import Corpus
+from helpers import make_document
+from text_analyzer import analyze
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        self.snapshots = {}
+        self.corpus = Corpus(self.reload, max_resident=1)
+        for doc_id, pages in [("tv", ["Kumanda pilleri nasıl değiştirilir", "Kanal ayarları menüsü"]),
+                              ("firin", ["Fırın kapağı temizliği", "Izgara ve pişirme modları"])]:
+            document = make_document(doc_id, pages)
+            self.snapshots[doc_id] = document.snapshot()
+            self.corpus.add(document)
+
+    def reload(self, document):
+        document.reset()
+        if document.doc_id not in self.snapshots:
+            raise FileNotFoundError(document.path)
+        document.restore(self.snapshots[document.doc_id])
+
+    def test_cold_documents_are_evicted(self):
+        self.assertFalse(self.corpus.get("tv").is_resident)
+        self.assertTrue(self.corpus.get("firin").is_resident)
+
+    def test_select_reloads_lazily(self):
+        selected = self.corpus.select(["tv"])
+        self.assertTrue(selected[0].is_resident)
+        self.assertFalse(self.corpus.get("firin").is_resident)
+
+    def test_select_skips_documents_that_fail_to_load(self):
+        del self.snapshots["tv"]
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            selected = self.corpus.select()
+        self.assertEqual([document.doc_id for document in selected], ["firin"])
+        self.assertFalse(self.corpus.get("tv").is_resident)
+        self.assertIn("tv.pdf", stderr.getvalue())
+        self.assertTrue(self.corpus.has_content())
+
+    def start_blocked_prefetch(self):
+        release = threading.Event()
+        started = threading.Event()
+        calls = []
+
+        def reload(document):
+            calls.append(document.doc_id)
+            started.set()
+            release.wait(5)
+            self.reload(document)
+
+        self.corpus.loader = reload
+        thread = threading.Thread(target=self.corpus.prefetch, args=(["tv"],))
+        thread.start()
+        self.assertTrue(started.wait(5))
+        return release, thread, calls
+
+    def test_prefetch_reloads_without_holding_the_lock(self):
+        release, thread, calls = self.start_blocked_prefetch()
+        tv = self.corpus.get("tv")
+        with self.corpus.lock:
+            self.assertEqual([document.doc_id for document in self.corpus.select(["firin"])], ["firin"])
+            self.assertTrue(tv.is_loading)
+            self.assertFalse(tv.is_resident)
+        release.set()
+        thread.join(5)
+        self.assertTrue(tv.is_resident)
+        self.assertFalse(tv.is_loading)
+        self.assertEqual(tv.page_count, 2)
+        self.assertEqual(calls, ["tv"])
+
+    def test_select_waits_for_reload_in_progress(self):
+        release, thread, calls = self.start_blocked_prefetch()
+        selected = []
+        reader = threading.Thread(target=lambda: selected.extend(self.corpus.select(["tv"])))
+        reader.start()
+        reader.join(0.2)
+        self.assertTrue(reader.is_alive())
+        release.set()
+        thread.join(5)
+        reader.join(5)
+        self.assertEqual([document.doc_id for document in selected], ["tv"])
+        self.assertEqual(calls, ["tv"])
+
+    def test_failed_prefetch_is_not_retried_under_the_lock(self):
+        del self.snapshots["tv"]
+        calls = []
+        self.corpus.loader = lambda document: (calls.append(document.doc_id), self.reload(document))
+        with patch('sys.stderr', new_callable=io.StringIO):
+            self.corpus.prefetch()
+            selected = self.corpus.select()
+        self.assertEqual([document.doc_id for document in selected], ["firin"])
+        self.assertEqual(calls, ["tv"])
+
+    def test_restore_rejects_incomplete_snapshot(self):
+        document = self.corpus.get("firin")
+        with self.assertRaises(ValueError):
+            document.restore(dict(self.snapshots["firin"], pages=None))
+        self.assertTrue(document.is_resident)
+
+    def test_rank_across_documents(self):
+        documents = self.corpus.select()
+        ranked = next(self.corpus.rank_batch([analyze("kumanda")], documents))
+        self.assertEqual(ranked[0][1].doc_id, "tv")
+
+    def test_rank_respects_filter(self):
+        documents = self.corpus.select(["firin"])
+        ranked = next(self.corpus.rank_batch([analyze("kumanda")], documents))
+        self.assertTrue(all(document.doc_id == "firin" for _, document, _ in ranked))
+
+    def test_rank_batch_matches_one_query_at_a_time(self):
+        documents = self.corpus.select()
+        questions = [analyze("kumanda pilleri"), [], analyze("fırın kapağı")]
+        batch = list(self.corpus.rank_batch(questions, documents))
+        self.assertEqual(batch[1], [])
+        for keywords, ranked in zip(questions, batch):
+            expected = next(self.corpus.rank_batch([keywords], documents))
+            self.assertEqual([(d.doc_id, c) for _, d, c in ranked], [(d.doc_id, c) for _, d, c in expected])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from document_cache import DocumentCache, file_hash
+from rag_system import RAGSystem
+
+class TestDocumentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DocumentCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.cache.store("abc-v1", {'page_texts': [{'page_num': 1, 'text': "Merhaba"}]})
+        self.assertEqual(self.cache.load("abc-v1")['page_texts'][0]['text'], "Merhaba")
+
+    def test_missing_entry(self):
+        self.assertIsNone(self.cache.load("yok-v1"))
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_key_depends_on_content_and_version(self):
+        rag_system = RAGSystem()
+        version = rag_system._cache_version()
+        first = file_hash(self.write("a.pdf", b"%PDF-1.4 test"))
+        self.assertEqual(first, file_hash(self.write("kopya.pdf", b"%PDF-1.4 test")))
+        self.assertNotEqual(first, file_hash(self.write("b.pdf", b"%PDF-1.4 baska")))
+
+        key = self.cache.make_key(first, version)
+        with patch.object(config, 'CHUNK_TOKENS', config.CHUNK_TOKENS + 100):
+            self.assertNotEqual(key, self.cache.make_key(first, rag_system._cache_version()))
+        with patch.object(config, 'EMBEDDING_DIM', config.EMBEDDING_DIM * 2):
+            self.assertNotEqual(key, self.cache.make_key(first, rag_system._cache_version()))
+
+    def test_invalid_entry_is_rejected_and_removed(self):
+        self.cache.store("abc-v1", {'pages': None})
+        self.assertIsNone(self.cache.load("abc-v1", lambda data: data['pages'] is not None))
+        self.assertFalse(os.path.exists(self.cache._path("abc-v1")))
+
+    def test_lru_eviction(self):
+        self.cache.max_bytes = 1500
+        self.cache.store("old-v1", "x" * 1000)
+        os.utime(self.cache._path("old-v1"), (0, 0))
+        self.cache.store("new-v1", "y" * 1000)
+        self.assertIsNone(self.cache.load("old-v1"))
+        self.assertEqual(self.cache.load("new-v1"), "y" * 1000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import config
+import pdf_extract
+from corpus import Document
+from document_cache import DocumentCache
+from pdf_extract import PAGES_PER_EXTRACT_WORKER, PAGES_PER_COLD_EXTRACT_WORKER
+from rag_system import RAGSystem
+from synthetic_pdf import write_pdf
+
+class TestParallelExtraction(unittest.TestCase):
+    PAGES = 3 * PAGES_PER_EXTRACT_WORKER + 7
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.pdf_path = write_pdf(os.path.join(cls.tmp.name, "kilavuz.pdf"), cls.PAGES, 60)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def extract(self, workers, progress=None):
+        rag_system = RAGSystem()
+        document = Document("doc", "kilavuz.pdf", self.pdf_path, "doc-v1", rag_system.count_tokens)
+        with patch.object(config, 'PDF_EXTRACT_WORKERS', workers):
+            pages = list(rag_system._iter_pages(document, progress))
+        return pages, document
+
+    def test_parallel_matches_sequential_order_and_text(self):
+        sequential, _ = self.extract(1)
+        progress = []
+        parallel, document = self.extract(4, progress.append)
+
+        self.assertEqual(document.pages_total, self.PAGES)
+        self.assertEqual([i for i, _ in parallel], list(range(self.PAGES)))
+        self.assertEqual(parallel, sequential)
+        self.assertIn("KOD00001", parallel[0][1])
+        self.assertEqual(progress[-1], 100)
+
+    def test_pool_is_kept_between_documents(self):
+        self.extract(4)
+        pool = pdf_extract._pool
+        self.assertIsNotNone(pool)
+        pages, _ = self.extract(4)
+        self.assertIs(pdf_extract._pool, pool)
+        self.assertEqual(len(pages), self.PAGES)
+
+class TestDocumentSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pdf_path = write_pdf(os.path.join(self.tmp.name, "firin.pdf"), 5, 40)
+        self.rag_system = RAGSystem()
+        self.rag_system.document_cache = DocumentCache(os.path.join(self.tmp.name, "cache"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snapshot_is_taken_before_the_document_can_be_evicted(self):
+        states = []
+        original = Document.snapshot
+
+        def snapshot(document):
+            states.append((document.is_loading, document.is_resident))
+            return original(document)
+
+        with patch.object(Document, 'snapshot', snapshot):
+            self.assertEqual(self.rag_system.process_pdf(self.pdf_path), 5)
+        self.assertEqual(states, [(True, True)])
+
+    def test_incomplete_cache_entry_is_discarded(self):
+        self.rag_system.process_pdf(self.pdf_path)
+        document = self.rag_system.corpus.documents[next(iter(self.rag_system.corpus.documents))]
+        self.rag_system.document_cache.store(document.cache_key, {'pages': None, 'index': None, 'embeddings': None})
+
+        rag_system = RAGSystem()
+        rag_system.document_cache = self.rag_system.document_cache
+        self.assertEqual(rag_system.process_pdf(self.pdf_path), 5)
+        self.assertIsNotNone(rag_system.document_cache.load(document.cache_key)['pages'])
+
+class TestPartialDocument(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pdf_path = write_pdf(os.path.join(self.tmp.name, "kilavuz.pdf"), 30, 60)
+        self.rag_system = RAGSystem()
+        self.rag_system.document_cache = DocumentCache(os.path.join(self.tmp.name, "cache"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_early_pages_are_answerable_while_loading(self):
+        seen = []
+
+        def pages_ready(loaded, total):
+            document = next(iter(self.rag_system.corpus.documents.values()))
+            context = self.rag_system.get_context_for_query("KOD00001 nasıl ayarlanır?")
+            seen.append((loaded, total, document.is_loading, self.rag_system.corpus.has_content(),
+                         "KOD00001" in context, f"KOD{loaded + 1:05d}" in context))
+
+        with patch.object(config, 'PDF_EXTRACT_WORKERS', 1):
+            self.assertEqual(self.rag_system.process_pdf(self.pdf_path, pages_callback=pages_ready), 30)
+
+        partial = [entry for entry in seen if entry[0] < entry[1]]
+        self.assertTrue(partial)
+        for loaded, total, is_loading, has_content, first_page, unpublished_page in partial:
+            self.assertEqual(total, 30)
+            self.assertTrue(is_loading)
+            self.assertTrue(has_content)
+            self.assertTrue(first_page)
+            self.assertFalse(unpublished_page)
+        self.assertEqual(seen[-1][:3], (30, 30, True))
+        self.assertFalse(self.rag_system.corpus.get(next(iter(self.rag_system.corpus.documents))).is_loading)
+
+class TestExactMatchRetrieval(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.rag_system = RAGSystem()
+        cls.rag_system.document_cache = DocumentCache(os.path.join(cls.tmp.name, "cache"))
+        cls.rag_system.process_pdf(write_pdf(os.path.join(cls.tmp.name, "kilavuz.pdf"), 60, 350))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_exact_match_query_keeps_context_small(self):
+        self.assertGreater(self.rag_system.total_tokens, config.MAX_CONTEXT_TOKENS)
+        context, sources = self.rag_system.build_contexts(["KOD00042 nasıl ayarlanır?"], config.MAX_CONTEXT_TOKENS)[0][::2]
+        self.assertIn("KOD00042", context)
+        self.assertEqual(sources[0]['pages'], [42])
+        self.assertLess(self.rag_system.count_tokens(context), 1000)
+
+class TestWorkerCount(unittest.TestCase):
+    def count(self, pages, method, pool_workers=None):
+        with patch.object(pdf_extract, 'start_method', return_value=method), \
+             patch.object(pdf_extract, '_pool', object() if pool_workers else None), \
+             patch.object(pdf_extract, '_pool_workers', pool_workers or 0):
+            return pdf_extract.worker_count(pages, 8)
+
+    def test_fork_starts_cheaply(self):
+        self.assertEqual(self.count(3 * PAGES_PER_EXTRACT_WORKER, "fork"), 3)
+        self.assertEqual(self.count(PAGES_PER_EXTRACT_WORKER - 1, "fork"), 0)
+
+    def test_cold_spawn_needs_more_pages(self):
+        self.assertEqual(self.count(3 * PAGES_PER_EXTRACT_WORKER, "spawn"), 0)
+        self.assertEqual(self.count(3 * PAGES_PER_COLD_EXTRACT_WORKER, "spawn"), 3)
+        self.assertEqual(self.count(100 * PAGES_PER_COLD_EXTRACT_WORKER, "spawn"), 8)
+
+    def test_warm_spawn_pool_is_used_without_growing(self):
+        self.assertEqual(self.count(3 * PAGES_PER_EXTRACT_WORKER, "spawn", pool_workers=2), 2)
+        self.assertEqual(self.count(8 * PAGES_PER_COLD_EXTRACT_WORKER, "spawn", pool_workers=2), 8)
+
+if __name__ == '__main__':
+    unittest.main()
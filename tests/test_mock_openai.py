@@ -0,0 +1,206 @@
+import unittest
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+import openai
+from langchain_core.messages import AIMessage
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from llm_client import ChatClientPool
+from helpers import make_document
+from mock_openai import create_mock_server
+from rag_system import RAGSystem, GENERAL_MODEL
+from rate_limiter import TokenRateLimiter
+
+class RecordingLimiter(TokenRateLimiter):
+    def __init__(self):
+        super().__init__(10 ** 9)
+        self.acquired = []
+        self.adjustments = []
+
+    def acquire(self, tokens):
+        self.acquired.append(tokens)
+        super().acquire(tokens)
+
+    def adjust(self, tokens):
+        self.adjustments.append(tokens)
+        super().adjust(tokens)
+
+class TestMockOpenAI(unittest.TestCase):
+    def start(self, **options):
+        server = create_mock_server(port=0, answer_tokens=5, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_models_list_and_key_check(self):
+        server = self.start()
+        original = config.OPENAI_BASE_URL
+        config.OPENAI_BASE_URL = server.base_url
+        try:
+            self.assertTrue(config.test_api_key("sk-test"))
+        finally:
+            config.OPENAI_BASE_URL = original
+
+    def test_read_timeout_follows_config(self):
+        self.assertEqual(RAGSystem().chat_clients.timeout.read, config.OPENAI_TIMEOUT)
+        with patch.object(config, 'OPENAI_TIMEOUT', 120.0):
+            pool = RAGSystem().chat_clients
+        self.addCleanup(pool.close)
+        self.assertEqual(pool.timeout.read, 120.0)
+        chat = pool.get("sk-test", GENERAL_MODEL, 0.5)
+        self.assertEqual(chat.root_client._client.timeout.read, 120.0)
+
+    def test_invoke_and_stream_through_rag_system(self):
+        server = self.start()
+        rag_system = RAGSystem()
+        rag_system.chat_clients = ChatClientPool(server.base_url)
+        self.addCleanup(rag_system.chat_clients.close)
+
+        answer = rag_system.query_general("Merhaba", "sk-test")
+        chunks = list(rag_system.query_general_stream("Merhaba", "sk-test"))
+        self.assertEqual(len(answer.split()), 5)
+        self.assertEqual("".join(chunks), answer)
+        self.assertEqual(server.stats['requests'], 2)
+
+    def rag_system(self, server):
+        rag_system = RAGSystem()
+        rag_system.chat_clients = ChatClientPool(server.base_url)
+        self.addCleanup(rag_system.chat_clients.close)
+        limiter = RecordingLimiter()
+        rag_system.rate_limiters[GENERAL_MODEL] = limiter
+        return rag_system, limiter
+
+    def test_stream_settles_reported_usage(self):
+        server = self.start()
+        rag_system, limiter = self.rag_system(server)
+        list(rag_system.query_general_stream("Merhaba", "sk-test"))
+        self.assertEqual(len(limiter.adjustments), 1)
+        self.assertLess(limiter.adjustments[0], 0)
+
+    def test_rejected_attempts_are_refunded(self):
+        server = self.start(error_rate=1.0, retry_after=0.01)
+        rag_system, limiter = self.rag_system(server)
+        original = config.RATE_LIMIT_RETRIES
+        config.RATE_LIMIT_RETRIES = 2
+        try:
+            answer = rag_system.query_general("Merhaba", "sk-test")
+        finally:
+            config.RATE_LIMIT_RETRIES = original
+        self.assertTrue(answer.startswith("Hata"))
+        self.assertEqual(server.stats['rejected'], 3)
+        self.assertEqual(limiter.adjustments, [-tokens for tokens in limiter.acquired])
+
+    def test_server_errors_are_retried_and_refunded(self):
+        server = self.start(error_rate=1.0, error_status=502)
+        rag_system, limiter = self.rag_system(server)
+        with patch.object(config, 'TRANSIENT_RETRIES', 2), patch('rag_system.backoff_delay', return_value=0.01):
+            answer = rag_system.query_general("Merhaba", "sk-test")
+        self.assertTrue(answer.startswith("Hata"))
+        self.assertEqual(server.stats['rejected'], 3)
+        self.assertEqual(limiter.adjustments, [-tokens for tokens in limiter.acquired])
+        self.assertEqual(limiter.paused_until, 0.0)
+
+    def test_single_server_error_recovers(self):
+        server = self.start(error_rate=0.5, error_status=502, seed=1)
+        rag_system, _ = self.rag_system(server)
+        with patch('rag_system.backoff_delay', return_value=0.01):
+            answer = rag_system.query_general("Merhaba", "sk-test")
+        self.assertEqual(len(answer.split()), 5)
+        self.assertEqual((server.stats['rejected'], server.stats['requests']), (1, 1))
+
+    def test_dropped_connection_is_retried(self):
+        rag_system = RAGSystem()
+        chat = MagicMock()
+        chat.invoke.side_effect = [
+            openai.APIConnectionError(request=httpx.Request("POST", "http://127.0.0.1/v1/chat/completions")),
+            AIMessage(content="Tamam")
+        ]
+        rag_system.chat_clients = MagicMock(get=MagicMock(return_value=chat))
+        with patch('rag_system.backoff_delay', return_value=0.01):
+            self.assertEqual(rag_system.query_general("Merhaba", "sk-test"), "Tamam")
+        self.assertEqual(chat.invoke.call_count, 2)
+
+    def test_rate_limit_injection(self):
+        server = self.start(error_rate=1.0, retry_after=3)
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        conn.request("POST", "/v1/chat/completions", body=json.dumps({'model': "gpt-4o", 'messages': []}),
+                     headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        body = json.loads(response.read())
+        conn.close()
+        self.assertEqual(response.status, 429)
+        self.assertEqual(response.getheader("retry-after"), "3")
+        self.assertEqual(body['error']['code'], "rate_limit_exceeded")
+
+class TestAsyncMockOpenAI(unittest.TestCase):
+    QUESTIONS = ["Kumanda pilleri nasıl değiştirilir?", "Kanal listesi nasıl sıralanır?",
+                 "Ses ayarı nereden yapılır?", "Ekran parlaklığı nasıl düşürülür?"]
+
+    def setUp(self):
+        self.server = create_mock_server(port=0, answer_tokens=5, latency_ms=30)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.rag_system = RAGSystem()
+        self.rag_system.chat_clients = ChatClientPool(self.server.base_url)
+        self.addCleanup(self.rag_system.chat_clients.close)
+        self.rag_system.max_concurrency = 2
+
+        self.rag_system.corpus.add(make_document("tv", ["Kumanda pilleri arka kapaktan değiştirilir.",
+                                                        "Kanal listesi menüden sıralanır.",
+                                                        "Ses ve ekran ayarları resim menüsündedir."],
+                                                 self.rag_system.count_tokens))
+
+    def run_async(self, coroutine):
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.rag_system.chat_clients.aclose()
+        return asyncio.run(run())
+
+    async def collect(self, stream):
+        return [chunk async for chunk in stream]
+
+    def test_aquery_and_stream_answer(self):
+        async def run():
+            answer = await self.rag_system.aquery(self.QUESTIONS[0], "sk-test")
+            chunks = await self.collect(self.rag_system.aquery_stream(self.QUESTIONS[1], "sk-test"))
+            summary = await self.rag_system.agenerate_summary(answer, "sk-test")
+            return answer, chunks, summary
+
+        answer, chunks, summary = self.run_async(run())
+        self.assertEqual(len(answer.split()), 5)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(len("".join(chunks).split()), 5)
+        self.assertEqual(len(summary.split()), 5)
+        self.assertEqual(self.server.stats['requests'], 3)
+
+    def test_concurrency_is_bounded_by_semaphore(self):
+        async def run():
+            return await asyncio.gather(
+                *(self.rag_system.aquery(question, "sk-test") for question in self.QUESTIONS),
+                *(self.collect(self.rag_system.aquery_stream(question + " Lütfen", "sk-test")) for question in self.QUESTIONS),
+                *(self.rag_system.agenerate_summary(question, "sk-test") for question in self.QUESTIONS)
+            )
+
+        results = self.run_async(run())
+        self.assertEqual(len(results), 12)
+        self.assertFalse([result for result in results if "Hata" in "".join(result)])
+        self.assertEqual(self.server.stats['in_flight'], 0)
+        self.assertGreater(self.server.stats['max_in_flight'], 1)
+        self.assertLessEqual(self.server.stats['max_in_flight'], self.rag_system.max_concurrency)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import os
+import sys
+import pickle
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_store import PageStore
+from chunker import chunk_spans
+
+class TestPageStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PageStore()
+        self.store.append(1, "Birinci sayfa", 3)
+        self.store.append(3, "Üçüncü sayfa", 3)
+
+    def test_full_text_matches_page_sections(self):
+        self.assertEqual(
+            self.store.text,
+            "\n\n--- SAYFA 1 ---\n\nBirinci sayfa\n\n--- SAYFA 3 ---\n\nÜçüncü sayfa"
+        )
+        self.assertEqual(self.store.text, self.store.section(0) + self.store.section(1))
+
+    def test_page_slices(self):
+        self.assertEqual(self.store.page_text(1), "Üçüncü sayfa")
+        self.assertEqual(self.store.page_nums[1], 3)
+
+    def test_append_after_materializing(self):
+        self.assertIn("Birinci", self.store.text)
+        self.store.append(4, "Dördüncü", 2)
+        self.assertEqual(self.store.page_text(2), "Dördüncü")
+        self.assertEqual(self.store.char_length, len(self.store.text))
+
+    def test_pickle_round_trip(self):
+        restored = pickle.loads(pickle.dumps(self.store))
+        self.assertEqual(restored.text, self.store.text)
+        self.assertEqual(list(restored.tokens), [3, 3])
+
+    def test_render_merges_overlapping_chunks(self):
+        self.store.add_chunk(0, 0, 7, 1)
+        self.store.add_chunk(0, 4, 13, 2)
+        self.store.add_chunk(1, 0, 6, 1)
+        self.assertEqual(
+            self.store.render_chunks([2, 1, 0]),
+            "\n\n--- SAYFA 1 ---\n\nBirinci sayfa\n\n--- SAYFA 3 ---\n\nÜçüncü"
+        )
+
+class TestChunker(unittest.TestCase):
+    def test_short_text_is_single_chunk(self):
+        self.assertEqual(chunk_spans("kısa metin", 2, 400), [(0, 10)])
+
+    def test_overlapping_windows_cover_text(self):
+        text = " ".join(f"kelime{i}" for i in range(100))
+        spans = chunk_spans(text, 100, 30, 10)
+        self.assertEqual(spans[0][0], 0)
+        self.assertEqual(spans[-1][1], len(text))
+        for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+            self.assertLess(next_start, prev_end)
+
+if __name__ == '__main__':
+    unittest.main()
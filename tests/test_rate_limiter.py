@@ -0,0 +1,75 @@
+import unittest
+import os
+import sys
+import time
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_limiter import TokenRateLimiter, backoff_delay, is_rate_limit_error, is_transient_error
+
+class RateLimitError(Exception):
+    status_code = 429
+
+class APIError(Exception):
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+class APIConnectionError(Exception):
+    pass
+
+class APITimeoutError(APIConnectionError):
+    pass
+
+class TestTokenRateLimiter(unittest.TestCase):
+    def test_acquire_within_budget_does_not_wait(self):
+        limiter = TokenRateLimiter(60000)
+        start = time.monotonic()
+        limiter.acquire(30000)
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertLessEqual(limiter.affordable_tokens(0), 30010)
+
+    def test_acquire_waits_for_refill(self):
+        limiter = TokenRateLimiter(6000)
+        limiter.acquire(6000)
+        start = time.monotonic()
+        limiter.acquire(20)
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_async_acquire_waits_for_refill(self):
+        limiter = TokenRateLimiter(6000)
+        limiter.acquire(6000)
+        start = time.monotonic()
+        asyncio.run(limiter.aacquire(20))
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_affordable_tokens_counts_refill(self):
+        limiter = TokenRateLimiter(60000)
+        limiter.acquire(60000)
+        self.assertGreaterEqual(limiter.affordable_tokens(2), 2000)
+        limiter.pause(2)
+        self.assertLess(limiter.affordable_tokens(2), 100)
+
+    def test_adjust_refunds_overestimate(self):
+        limiter = TokenRateLimiter(60000)
+        limiter.acquire(10000)
+        limiter.adjust(-5000)
+        self.assertGreaterEqual(limiter.affordable_tokens(0), 55000)
+
+class TestRetryHelpers(unittest.TestCase):
+    def test_detects_rate_limit(self):
+        self.assertTrue(is_rate_limit_error(RateLimitError()))
+        self.assertFalse(is_rate_limit_error(ValueError()))
+
+    def test_detects_transient_errors(self):
+        for error in (APIError(502), APIError(500), APIError(408), APIConnectionError(), APITimeoutError(), ConnectionResetError()):
+            self.assertTrue(is_transient_error(error), error)
+        for error in (APIError(400), APIError(401), RateLimitError(), ValueError()):
+            self.assertFalse(is_transient_error(error), error)
+
+    def test_backoff_is_capped(self):
+        for attempt in range(10):
+            self.assertLessEqual(backoff_delay(attempt, base=1.0, cap=5.0), 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import BM25Index
+from text_analyzer import analyze
+from embedding_index import HashedEmbeddingIndex
+
+class TestBM25Index(unittest.TestCase):
+    def setUp(self):
+        self.index = BM25Index()
+        self.index.add_document(analyze("Cihazı açmak için güç tuşuna basın."))
+        self.index.add_document(analyze("Menü ayarları ve ekran parlaklığı."))
+        self.index.add_document(analyze("Menü tuşu ile menü açılır, menü kapanır."))
+
+    def test_only_matching_pages_are_returned(self):
+        ranked = self.index.search(analyze("menü"))
+        self.assertEqual({doc_id for doc_id, _ in ranked}, {1, 2})
+
+    def test_higher_term_frequency_ranks_first(self):
+        ranked = self.index.search(analyze("menü"))
+        self.assertEqual(ranked[0][0], 2)
+
+    def test_top_k(self):
+        self.assertEqual(len(self.index.search(analyze("menü güç"), top_k=1)), 1)
+
+    def test_unknown_term(self):
+        self.assertEqual(self.index.search(analyze("yazıcı")), [])
+
+class TestHashedEmbeddingIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = HashedEmbeddingIndex(dim=256)
+        self.index.add(analyze("yazılım güncellemesi nasıl yapılır"))
+        self.index.add(analyze("pil şarj süresi ve adaptör"))
+
+    def test_one_row_per_document(self):
+        self.assertEqual(self.index.matrix.shape, (2, 256))
+
+    def test_inflected_query_prefers_related_text(self):
+        similarities = self.index.similarities_batch([analyze("güncelleme")])[:, 0]
+        self.assertGreater(similarities[0], similarities[1])
+
+    def test_batch_matches_one_query_at_a_time(self):
+        queries = [analyze("güncelleme"), analyze("pil adaptör")]
+        batch = self.index.similarities_batch(queries)
+        self.assertEqual(batch.shape, (len(self.index), 2))
+        for q, tokens in enumerate(queries):
+            self.assertTrue(np.allclose(batch[:, q], self.index.similarities_batch([tokens])[:, 0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+import http.client
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import create_server
+
+class StubRAG:
+    is_loading = False
+
+    def __init__(self):
+        self.loaded = []
+
+    def process_pdf(self, pdf_path):
+        if pdf_path.endswith("bozuk.pdf"):
+            raise OSError(f"[Errno 5] {pdf_path}")
+        self.loaded.append(pdf_path)
+        return 3
+
+    def list_documents(self):
+        return [{'doc_id': "abc", 'name': "kilavuz.pdf", 'pages': 3}]
+
+    def query(self, question, api_key, doc_ids=None):
+        return "###ASK_FALLBACK###" if question == "yok" else f"Cevap: {question}"
+
+    def query_stream(self, question, api_key, doc_ids=None):
+        yield "Merhaba "
+        yield "dünya"
+
+class TestServer(unittest.TestCase):
+    token = ""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "belgeler")
+        os.makedirs(self.root)
+        self.rag = StubRAG()
+        self.server = create_server(self.rag, port=0, api_key="sk-test", document_root=self.root, token=self.token)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def request(self, method, path, payload=None, headers=None):
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=5)
+        body = json.dumps(payload) if payload is not None else None
+        conn.request(method, path, body=body, headers={"Content-Type": "application/json", **(headers or {})})
+        response = conn.getresponse()
+        data = response.read().decode('utf-8')
+        conn.close()
+        return response.status, data
+
+    def test_documents(self):
+        status, data = self.request("GET", "/documents")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(data)['documents'][0]['name'], "kilavuz.pdf")
+
+    def test_query(self):
+        status, data = self.request("POST", "/query", {'question': "Güç tuşu"})
+        self.assertEqual(json.loads(data), {'answer': "Cevap: Güç tuşu", 'fallback': False})
+
+    def test_query_fallback(self):
+        _, data = self.request("POST", "/query", {'question': "yok"})
+        self.assertTrue(json.loads(data)['fallback'])
+
+    def test_query_requires_question(self):
+        status, _ = self.request("POST", "/query", {})
+        self.assertEqual(status, 400)
+
+    def test_malformed_payloads_are_rejected(self):
+        for path, payload in (("/query", []), ("/query", "selam"), ("/query/stream", [1]), ("/documents", []),
+                              ("/query", {'question': 5}), ("/documents", {'path': ["a.pdf"]}),
+                              ("/query", {'question': "selam", 'doc_ids': "abc"}),
+                              ("/query/stream", {'question': "selam", 'doc_ids': [1, 2]})):
+            status, data = self.request("POST", path, payload)
+            self.assertEqual(status, 400, (path, payload))
+            self.assertIn('error', json.loads(data))
+        status, _ = self.request("POST", "/query", {'question': "selam", 'doc_ids': ["abc"]})
+        self.assertEqual(status, 200)
+
+    def test_stream(self):
+        status, data = self.request("POST", "/query/stream", {'question': "selam"})
+        self.assertEqual(status, 200)
+        self.assertIn('"text": "Merhaba "', data)
+        self.assertTrue(data.rstrip().endswith("event: done\ndata: {}"))
+
+    def write(self, directory, name):
+        path = os.path.join(directory, name)
+        with open(path, 'wb') as f:
+            f.write(b"%PDF-1.4")
+        return path
+
+    def test_load_document_under_root(self):
+        path = self.write(self.root, "kilavuz.pdf")
+        status, data = self.request("POST", "/documents", {'path': "kilavuz.pdf"})
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(data)['pages'], 3)
+        self.assertEqual(self.rag.loaded, [os.path.realpath(path)])
+
+    def test_load_document_outside_root_is_rejected(self):
+        outside = self.write(self.tmp.name, "gizli.pdf")
+        for path in (outside, "../gizli.pdf", "yok.pdf", self.root, "/dev/zero"):
+            status, data = self.request("POST", "/documents", {'path': path})
+            self.assertEqual(status, 404, path)
+            self.assertEqual(json.loads(data), {'error': "Belge bulunamadı"})
+        self.assertEqual(self.rag.loaded, [])
+
+    def test_load_error_does_not_leak_details(self):
+        self.write(self.root, "bozuk.pdf")
+        status, data = self.request("POST", "/documents", {'path': "bozuk.pdf"})
+        self.assertEqual(status, 422)
+        self.assertEqual(json.loads(data), {'error': "PDF işlenemedi"})
+
+    def test_non_loopback_requires_token(self):
+        with self.assertRaises(ValueError):
+            create_server(StubRAG(), host="0.0.0.0", port=0, token="")
+
+class TestServerToken(TestServer):
+    token = "gizli-anahtar"
+
+    def request(self, method, path, payload=None, headers=None):
+        return super().request(method, path, payload, {"Authorization": f"Bearer {self.token}", **(headers or {})})
+
+    def test_missing_or_wrong_token_is_rejected(self):
+        for headers in ({"Authorization": ""}, {"Authorization": "Bearer yanlis"}):
+            status, _ = super().request("GET", "/documents", headers=headers)
+            self.assertEqual(status, 401)
+            status, _ = super().request("POST", "/query", {'question': "selam"}, headers)
+            self.assertEqual(status, 401)
+        status, _ = super().request("GET", "/health", headers={"Authorization": ""})
+        self.assertEqual(status, 200)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_analyzer import analyze, turkish_casefold
+
+class TestTextAnalyzer(unittest.TestCase):
+    def test_turkish_casefold(self):
+        self.assertEqual(turkish_casefold("İZMİR ISPARTA"), "izmir ısparta")
+
+    def test_suffixed_forms_share_stem(self):
+        self.assertEqual(analyze("tuş"), analyze("tuşuna"))
+        self.assertEqual(analyze("Tuşları"), analyze("tuşu"))
+
+    def test_diacritics_are_folded(self):
+        self.assertEqual(analyze("şarj göstergesi"), analyze("sarj gostergesi"))
+
+    def test_stopwords_are_removed(self):
+        self.assertEqual(analyze("Bu ayar nasıl ve neden değişir?"), analyze("ayar değişir"))
+
+    def test_short_model_numbers_are_kept(self):
+        self.assertIn("a5", analyze("A5 modeli"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_processor import SentenceSplitter
+
+def split_streamed(text, step=3):
+    splitter = SentenceSplitter()
+    sentences = []
+    for i in range(0, len(text), step):
+        sentences.extend(splitter.feed(text[i:i + step]))
+    return sentences + splitter.flush()
+
+class TestSentenceSplitter(unittest.TestCase):
+    def test_emits_sentences_as_tokens_arrive(self):
+        splitter = SentenceSplitter()
+        self.assertEqual(splitter.feed("Cihazı açmak için güç tuşuna basın."), [])
+        self.assertEqual(splitter.feed(" Sonra"), ["Cihazı açmak için güç tuşuna basın."])
+        self.assertEqual(splitter.flush(), ["Sonra"])
+
+    def test_abbreviations_and_numbers_do_not_split(self):
+        sentences = split_streamed("Ayarları örn. menü tuşuyla açın. Sürüm 3.5 ve üzeri gereklidir! Son")
+        self.assertEqual(sentences, ["Ayarları örn. menü tuşuyla açın.", "Sürüm 3.5 ve üzeri gereklidir!", "Son"])
+
+    def test_short_fragments_are_merged(self):
+        self.assertEqual(split_streamed("Evet. Bu işlem birkaç dakika sürebilir. "),
+                         ["Evet. Bu işlem birkaç dakika sürebilir."])
+
+    def test_newlines_split_list_items(self):
+        sentences = split_streamed("Menüden ayarlar bölümüne girin\nOK tuşuyla seçimi onaylayın\n")
+        self.assertEqual(sentences, ["Menüden ayarlar bölümüne girin", "OK tuşuyla seçimi onaylayın"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracing import NULL_SPAN, Tracer, summarize_file
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "trace.jsonl")
+        self.tracer = Tracer(self.path)
+
+    def tearDown(self):
+        self.tracer.durations.clear()
+        self.tracer.close()
+        self.tmp.cleanup()
+
+    def records(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_disabled_tracer_returns_null_span(self):
+        tracer = Tracer()
+        self.assertIs(tracer.begin("request"), NULL_SPAN)
+        with tracer.span("retrieval") as span:
+            self.assertIs(span, NULL_SPAN)
+        self.assertEqual(tracer.durations, {})
+
+    def test_spans_share_trace_across_threads(self):
+        root = self.tracer.begin("request")
+
+        def worker():
+            with self.tracer.activate(root.trace_id):
+                with self.tracer.span("retrieval", max_tokens=100):
+                    pass
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        root.end()
+        root.end()
+
+        records = self.records()
+        self.assertEqual([r['span'] for r in records], ["retrieval", "request"])
+        self.assertTrue(all(r['trace'] == root.trace_id for r in records))
+        self.assertEqual(records[0]['max_tokens'], 100)
+
+    def test_error_is_recorded(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span("tts"):
+                raise ValueError()
+        self.assertEqual(self.records()[0]['error'], "ValueError")
+
+    def test_summary_percentiles(self):
+        for _ in range(4):
+            self.tracer.span("llm.gpt-4o").end()
+        self.assertEqual(self.tracer.summary()["llm.gpt-4o"]['count'], 4)
+        self.assertEqual(summarize_file(self.path)["llm.gpt-4o"]['count'], 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import tempfile
+import wave
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import workers
+from audio_cache import AudioCache
+
+class FakeEngine:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.properties = {}
+        self.pending = []
+        self.spoken = []
+        self.saved = []
+
+    def getProperty(self, name):
+        voice = MagicMock(id="TTS_MS_TR-TR_TOLGA_11.0")
+        voice.name = "Microsoft Tolga"
+        return [voice]
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def save_to_file(self, text, path):
+        if text == self.fail_on:
+            raise RuntimeError("run loop already started")
+        self.spoken.append(text)
+        self.saved.append(path)
+        self.pending.append(path)
+
+    def runAndWait(self):
+        for path in self.pending:
+            with wave.open(path, 'wb') as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(22050)
+                f.writeframes(b"\x01\x00" * 2205)
+        self.pending = []
+
+class TestPersistentTTSWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.audio_cache = AudioCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_worker(self, texts, fail_on=None):
+        engines = []
+
+        def init():
+            engines.append(FakeEngine(fail_on))
+            return engines[-1]
+
+        worker = workers.PersistentTTSWorker(self.audio_cache)
+        buffers, errors = [], []
+        worker.finished.connect(buffers.append)
+        worker.error.connect(errors.append)
+        for text in texts:
+            worker.speak(text)
+        worker.queue.put(None)
+
+        fake_pyttsx3 = MagicMock(init=MagicMock(side_effect=init))
+        with patch.object(workers, 'HAS_PYTTSX3', True), \
+             patch.object(workers, 'pyttsx3', fake_pyttsx3, create=True), \
+             patch.dict(sys.modules, {'pythoncom': MagicMock()}):
+            worker.run()
+        return worker, engines, buffers, errors
+
+    def test_engine_is_reused_across_utterances(self):
+        worker, engines, buffers, errors = self.run_worker(["Bir.", "İki.", "Üç."])
+        self.assertEqual(len(engines), 1)
+        self.assertEqual(len(buffers), 3)
+        self.assertEqual(errors, [])
+        self.assertEqual(worker.voice_id, "TTS_MS_TR-TR_TOLGA_11.0")
+
+    def test_engine_is_reinitialized_after_failure(self):
+        _, engines, buffers, errors = self.run_worker(["Bir.", "Hata", "Üç."], fail_on="Hata")
+        self.assertEqual(len(engines), 2)
+        self.assertEqual(len(buffers), 2)
+        self.assertEqual(len(errors), 1)
+
+    def test_repeated_text_is_served_from_cache(self):
+        _, engines, buffers, _ = self.run_worker(["Güç tuşuna basın.", "Güç  tuşuna basın. ", "Menüyü açın."])
+        self.assertEqual(engines[0].spoken, ["Güç tuşuna basın.", "Menüyü açın."])
+        self.assertEqual(bytes(buffers[0].data), bytes(buffers[1].data))
+        self.assertEqual(len([name for name in os.listdir(self.tmp.name) if name.endswith(".wav")]), 2)
+
+    def test_cached_text_does_not_start_the_engine(self):
+        self.run_worker(["Güç tuşuna basın."])
+        worker, engines, buffers, errors = self.run_worker(["Güç tuşuna basın."])
+        self.assertEqual(engines, [])
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(errors, [])
+        self.assertEqual(worker.voice_id, "TTS_MS_TR-TR_TOLGA_11.0")
+
+        _, engines, buffers, _ = self.run_worker(["Güç tuşuna basın.", "Menüyü açın."])
+        self.assertEqual(len(engines), 1)
+        self.assertEqual(engines[0].spoken, ["Menüyü açın."])
+
+    def test_emits_in_memory_pcm_without_leftover_files(self):
+        _, engines, buffers, _ = self.run_worker(["Bir."])
+        pcm = buffers[0]
+        self.assertEqual((pcm.sample_rate, pcm.channels, pcm.bits), (22050, 1, 16))
+        self.assertAlmostEqual(pcm.duration_ms, 100.0)
+        self.assertFalse(any(os.path.exists(path) for path in engines[0].saved))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+TURKISH_UPPER_MAP = str.maketrans({"I": "ı", "İ": "i"})
+DIACRITIC_MAP = str.maketrans({
+    "ç": "c", "ğ": "g", "ı": "i", "ö": "o", "ş": "s", "ü": "u",
+    "â": "a", "î": "i", "û": "u",
+})
+
+STOPWORDS = {
+    "acaba", "ama", "ancak", "artik", "aslinda", "bazi", "belki", "ben", "beri", "bile", "bir",
+    "biri", "birkac", "birsey", "biz", "bu", "buna", "bunda", "bundan", "bunu", "bunun", "cok",
+    "cunku", "da", "daha", "de", "defa", "diye", "en", "fakat", "gibi", "hangi", "hem", "hep",
+    "hepsi", "her", "hic", "icin", "ile", "ise", "kadar", "kez", "ki", "kim", "mi", "mu", "nasil",
+    "ne", "neden", "nedir", "nerede", "nereye", "nicin", "niye", "olan", "olarak", "oldu", "olur",
+    "on", "once", "sey", "siz", "sonra", "su", "sunu", "tum", "var", "ve", "veya", "ya", "yani",
+    "yapilir", "yok", "zaten",
+    "the", "and", "for", "with", "how", "what", "are", "you", "this", "that",
+}
+
+SUFFIXES = sorted({
+    "lar", "ler", "lari", "leri", "larin", "lerin", "larini", "lerini", "larinda", "lerinde",
+    "larindan", "lerinden",
+    "da", "de", "ta", "te", "nda", "nde", "dan", "den", "tan", "ten", "ndan", "nden",
+    "in", "un", "nin", "nun", "yin", "yun", "inin", "unun",
+    "a", "e", "ya", "ye", "na", "ne", "ina", "ine", "una", "une",
+    "i", "u", "yi", "yu", "si", "su", "ni", "nu", "ini", "unu",
+    "la", "le", "yla", "yle", "ile",
+    "im", "um", "imiz", "umuz", "iniz", "unuz", "miz", "muz", "niz", "nuz",
+    "dir", "dur", "tir", "tur", "mak", "mek", "mali", "meli",
+}, key=len, reverse=True)
+MIN_STEM_LENGTH = 3
+
+
+def turkish_casefold(text):
+    return text.translate(TURKISH_UPPER_MAP).lower()
+
+
+def fold_diacritics(text):
+    text = text.translate(DIACRITIC_MAP)
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=65536)
+def stem(word):
+    for _ in range(3):
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+                word = word[:-len(suffix)]
+                break
+        else:
+            break
+    return word
+
+
+def normalize(text):
+    return fold_diacritics(turkish_casefold(text))
+
+
+def analyze(text):
+    terms = []
+    for word in WORD_PATTERN.findall(normalize(text)):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 2:
+            terms.append(stem(word))
+        elif any(ch.isdigit() for ch in word):
+            terms.append(word)
+    return terms
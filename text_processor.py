@@ -10,6 +10,10 @@ SYMBOL_MAP = {
     "&": " ve ", "%": " yüzde ", "@": " et ",
 }
 
+SENTENCE_END = re.compile(r'[.!?…]+[)"\'»]*\s+|\n\s*')
+LAST_WORD = re.compile(r'(\w+)[.!?…]*[)"\'»]*$')
+ABBREVIATIONS = {"örn", "vb", "vs", "bkz", "dr", "sn", "no", "nr", "yy", "vd", "st", "min", "max", "maks", "yak"}
+
 def basic_text_cleanup(text):
     result = text
     for symbol, replacement in SYMBOL_MAP.items():
@@ -21,3 +25,34 @@ def basic_text_cleanup(text):
 
 def process_text_for_tts(text):
     return basic_text_cleanup(text)
+
+class SentenceSplitter:
+    def __init__(self, min_chars=20):
+        self.min_chars = min_chars
+        self.buffer = ""
+
+    def _is_boundary(self, candidate):
+        if len(candidate) < self.min_chars:
+            return False
+        match = LAST_WORD.search(candidate)
+        if match is None:
+            return True
+        word = match.group(1)
+        return not (word.isdigit() or word.lower() in ABBREVIATIONS) or candidate.endswith(("!", "?"))
+
+    def feed(self, text):
+        self.buffer += text
+        sentences = []
+        start = 0
+        for match in SENTENCE_END.finditer(self.buffer):
+            candidate = self.buffer[start:match.end()].strip()
+            if self._is_boundary(candidate):
+                sentences.append(candidate)
+                start = match.end()
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self):
+        rest = self.buffer.strip()
+        self.buffer = ""
+        return [rest] if rest else []
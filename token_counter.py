@@ -0,0 +1,30 @@
+from functools import lru_cache
+
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+DEFAULT_MODEL = "gpt-4o"
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model=DEFAULT_MODEL):
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+
+def count_tokens(text, model=DEFAULT_MODEL):
+    encoding = get_encoding(model)
+    if encoding is None:
+        return int(len(text) / CHARS_PER_TOKEN_ESTIMATE)
+    return len(encoding.encode(text, disallowed_special=()))
@@ -0,0 +1,166 @@
+import atexit
+import contextvars
+import json
+import sys
+import threading
+import time
+import uuid
+
+import config
+
+_current_trace = contextvars.ContextVar('current_trace', default=None)
+
+
+class _NullSpan:
+    trace_id = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def end(self, **attrs):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ('tracer', 'name', 'trace_id', 'attrs', 'started', 'wall_started', 'ended')
+
+    def __init__(self, tracer, name, trace_id, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.attrs = attrs
+        self.wall_started = time.time()
+        self.started = time.perf_counter()
+        self.ended = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.end()
+        return False
+
+    def end(self, **attrs):
+        if self.ended:
+            return
+        self.ended = True
+        self.attrs.update(attrs)
+        self.tracer._record(self, time.perf_counter() - self.started)
+
+
+class Tracer:
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.durations = {}
+        self._file = None
+        self._lock = threading.Lock()
+        if self.enabled:
+            atexit.register(self.close)
+
+    def begin(self, name, **attrs):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, uuid.uuid4().hex[:16], attrs)
+
+    def span(self, name, trace_id=None, **attrs):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, trace_id or _current_trace.get(), attrs)
+
+    def activate(self, trace_id):
+        return _Activation(trace_id)
+
+    def _record(self, span, duration):
+        record = {
+            'trace': span.trace_id,
+            'span': span.name,
+            'start': round(span.wall_started, 6),
+            'duration_ms': round(duration * 1000, 3),
+            'thread': threading.current_thread().name,
+        }
+        record.update(span.attrs)
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self.durations.setdefault(span.name, []).append(duration * 1000)
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def summary(self):
+        with self._lock:
+            return {name: percentiles(values) for name, values in self.durations.items()}
+
+    def print_summary(self, file=None):
+        print_summary(self.summary(), file or sys.stderr)
+
+    def close(self):
+        if self.durations:
+            self.print_summary()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _Activation:
+    def __init__(self, trace_id):
+        self.trace_id = trace_id
+        self.token = None
+
+    def __enter__(self):
+        if self.trace_id is not None:
+            self.token = _current_trace.set(self.trace_id)
+        return self
+
+    def __exit__(self, *exc):
+        if self.token is not None:
+            _current_trace.reset(self.token)
+        return False
+
+
+def percentiles(values):
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(q * len(values)))], 3)
+
+    return {'count': len(values), 'p50_ms': pick(0.50), 'p95_ms': pick(0.95)}
+
+
+def print_summary(stats, file=None):
+    file = file or sys.stdout
+    print(f"{'aşama':<24}{'adet':>8}{'p50 ms':>12}{'p95 ms':>12}", file=file)
+    for name, stat in sorted(stats.items()):
+        print(f"{name:<24}{stat['count']:>8}{stat['p50_ms']:>12.1f}{stat['p95_ms']:>12.1f}", file=file)
+
+
+def summarize_file(path):
+    durations = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                durations.setdefault(record['span'], []).append(record['duration_ms'])
+    return {name: percentiles(values) for name, values in durations.items()}
+
+
+tracer = Tracer(config.TRACE_FILE)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Kullanım: python tracing.py <iz_dosyası.jsonl>", file=sys.stderr)
+        sys.exit(2)
+    print_summary(summarize_file(sys.argv[1]))
@@ -1,11 +1,12 @@
 import tempfile
 import queue
 import os
-import time
-import random
 from PyQt6.QtCore import QThread, pyqtSignal
 import config
+from audio_buffer import read_wav
+from audio_cache import AudioCache
 from text_processor import process_text_for_tts
+from tracing import tracer
 
 try:
     import pyttsx3
@@ -16,6 +17,7 @@ except ImportError:
 
 class LoadPDFWorker(QThread):
     progress = pyqtSignal(int)
+    pages_ready = pyqtSignal(int, int)
     finished = pyqtSignal(int)
     error = pyqtSignal(str)
 
@@ -26,7 +28,11 @@ class LoadPDFWorker(QThread):
 
     def run(self):
         try:
-            count = self.rag.process_pdf(self.path, lambda x: self.progress.emit(x))
+            count = self.rag.process_pdf(
+                self.path,
+                lambda x: self.progress.emit(x),
+                lambda loaded, total: self.pages_ready.emit(loaded, total)
+            )
             self.finished.emit(count)
         except Exception as e:
             self.error.emit(str(e))
@@ -36,31 +42,33 @@ class QueryWorker(QThread):
     token_received = pyqtSignal(str)
     error = pyqtSignal(str)
     
-    def __init__(self, rag_system, question, mode="rag"):
+    def __init__(self, rag_system, question, mode="rag", trace_id=None):
         super().__init__()
         self.rag = rag_system
         self.question = question
         self.mode = mode
+        self.trace_id = trace_id
 
     def run(self):
+        with tracer.activate(self.trace_id):
+            self._run()
+
+    def _run(self):
         try:
             if self.mode == "rag":
-                res = self.rag.query(self.question, config.API_KEY)
+                stream = self.rag.query_stream(self.question, config.API_KEY)
             else:
-                res = self.rag.query_general(self.question, config.API_KEY)
-
-            if res == "###ASK_FALLBACK###":
-                self.finished.emit(res)
-                return
+                stream = self.rag.query_general_stream(self.question, config.API_KEY)
 
-            words = res.split(" ")
             accumulated_text = ""
-            
-            for word in words:
-                chunk = word + " "
+
+            for chunk in stream:
+                if chunk == "###ASK_FALLBACK###" and not accumulated_text:
+                    self.finished.emit(chunk)
+                    return
+
                 self.token_received.emit(chunk)
                 accumulated_text += chunk
-                time.sleep(random.uniform(0.02, 0.05))
 
             self.finished.emit(accumulated_text)
             
@@ -68,22 +76,48 @@ class QueryWorker(QThread):
             self.error.emit(str(e))
 
 class PersistentTTSWorker(QThread):
-    finished = pyqtSignal(str)
+    finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
-    def __init__(self):
+    def __init__(self, audio_cache=None):
         super().__init__()
         self.queue = queue.Queue()
         self.running = True
+        self.audio_cache = audio_cache or AudioCache(config.TTS_CACHE_DIR, config.TTS_CACHE_MAX_MB * 1024 * 1024)
+        # Voice found on a previous run, so cached phrases can be served before the engine starts
+        self.voice_id = self.audio_cache.load_voice()
 
-    def speak(self, text):
-        self.queue.put(text)
+    def speak(self, text, trace_id=None):
+        self.queue.put((text, trace_id))
 
     def stop(self):
         self.running = False
         self.queue.put(None)
         self.wait()
 
+    def _find_turkish_voice(self, engine):
+        for voice in engine.getProperty('voices'):
+            if "tr" in voice.id.lower() or "turkish" in voice.name.lower() or "tolga" in voice.name.lower():
+                return voice.id
+        return ""
+
+    def _init_engine(self):
+        engine = pyttsx3.init()
+        voice_id = self._find_turkish_voice(engine)
+        if voice_id != self.voice_id:
+            self.voice_id = voice_id
+            self.audio_cache.save_voice(voice_id)
+        if self.voice_id:
+            engine.setProperty('voice', self.voice_id)
+        engine.setProperty('rate', config.TTS_LOCAL_RATE)
+        return engine
+
+    def _cached(self, clean_text):
+        if self.voice_id is None:
+            return None
+        cached_path = self.audio_cache.get(self.audio_cache.key_for(clean_text, self.voice_id, config.TTS_LOCAL_RATE))
+        return read_wav(cached_path) if cached_path else None
+
     def run(self):
         if not HAS_PYTTSX3:
             self.error.emit("pyttsx3 modülü eksik.")
@@ -91,69 +125,79 @@ class PersistentTTSWorker(QThread):
 
         try:
             import pythoncom
-            
+            pythoncom.CoInitialize()
+        except Exception as e:
+            self.error.emit(f"TTS Başlatma Hatası: {e}")
+            return
+
+        engine = None
+        
+        try:
             while self.running:
-                text = self.queue.get()
-                if text is None:
+                item = self.queue.get()
+                if item is None:
                     break
+                text, trace_id = item
+                span = tracer.span("tts", trace_id, chars=len(text), warm=engine is not None)
+                temp_file = None
                 
                 try:
-                    pythoncom.CoInitialize()
-                    engine = pyttsx3.init()
-                    
-                    voices = engine.getProperty('voices')
-                    turkish_voice = None
-                    for voice in voices:
-                        if "tr" in voice.id.lower() or "turkish" in voice.name.lower() or "tolga" in voice.name.lower():
-                            turkish_voice = voice.id
-                            break
-                    
-                    if turkish_voice:
-                        engine.setProperty('voice', turkish_voice)
-                    
-                    engine.setProperty('rate', config.TTS_LOCAL_RATE)
-                    
-                    from text_processor import basic_text_cleanup
-                    clean_text = basic_text_cleanup(text)
+                    clean_text = process_text_for_tts(text)
+                    pcm = self._cached(clean_text)
+                    if pcm is None and engine is None:
+                        with tracer.span("tts_init", trace_id):
+                            engine = self._init_engine()
+                        pcm = self._cached(clean_text)
+                    if pcm is not None:
+                        span.end(cached=True)
+                        self.finished.emit(pcm)
+                        continue
                     
+                    cache_key = self.audio_cache.key_for(clean_text, self.voice_id, config.TTS_LOCAL_RATE)
                     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
                     temp_file.close()
                     
                     engine.save_to_file(clean_text, temp_file.name)
                     engine.runAndWait()
                     
-                    del engine
-                    pythoncom.CoUninitialize()
-                    
                     if os.path.exists(temp_file.name) and os.path.getsize(temp_file.name) > 0:
-                        self.finished.emit(temp_file.name)
+                        pcm = read_wav(self.audio_cache.put(cache_key, temp_file.name) or temp_file.name)
+                        span.end(cached=False)
+                        self.finished.emit(pcm)
                     else:
+                        span.end(cached=False)
+                        engine = None
                         self.error.emit("Ses dosyası oluşturulamadı.")
                         
                 except Exception as e:
+                    span.end(error=type(e).__name__)
+                    engine = None
                     self.error.emit(str(e))
-                    try:
-                        pythoncom.CoUninitialize()
-                    except:
-                        pass
                 finally:
+                    if temp_file is not None and os.path.exists(temp_file.name):
+                        os.remove(temp_file.name)
                     self.queue.task_done()
-                    
-        except Exception as e:
-            self.error.emit(f"TTS Başlatma Hatası: {e}")
+        finally:
+            engine = None
+            try:
+                pythoncom.CoUninitialize()
+            except:
+                pass
 
 class SummaryWorker(QThread):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, rag_system, text):
+    def __init__(self, rag_system, text, trace_id=None):
         super().__init__()
         self.rag_system = rag_system
         self.text = text
+        self.trace_id = trace_id
 
     def run(self):
         try:
-            summary = self.rag_system.generate_summary(self.text, config.API_KEY)
+            with tracer.activate(self.trace_id), tracer.span("summary", chars=len(self.text)):
+                summary = self.rag_system.generate_summary(self.text, config.API_KEY)
             self.finished.emit(summary)
         except Exception as e:
             self.error.emit(str(e))